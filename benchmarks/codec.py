@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Decode time of large order and product pages with every JSON library
+installed, from the response bytes and, for comparison, from a decoded
+text copy like the old add/update path did.
+
+    $ python -m benchmarks.codec [page size] [rounds]
+"""
+import json
+import sys
+import timeit
+
+from .payloads import order_page, product_page
+
+
+def _libraries():
+    libraries = [('json', json.loads)]
+    for name in ('simplejson', 'ujson', 'orjson'):
+        try:
+            libraries.append((name, __import__(name).loads))
+        except ImportError:
+            print('{} is not installed, skipping it'.format(name))
+    return libraries
+
+
+def main(size=200, rounds=20):
+    libraries = _libraries()
+    for page_name, page in (('orders', order_page(size)), ('products', product_page(size))):
+        content = json.dumps(page).encode('utf-8')
+        print('{} page: {} records, {} bytes'.format(page_name, size, len(content)))
+        for name, loads in libraries:
+            from_bytes = timeit.timeit(lambda: loads(content), number=rounds) / rounds
+            from_text = timeit.timeit(lambda: loads(content.decode('utf-8')),
+                                      number=rounds) / rounds
+            print('  {:<12} bytes {:>8.2f} ms   text {:>8.2f} ms'.format(
+                name, from_bytes * 1000, from_text * 1000))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
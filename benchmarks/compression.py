@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Bytes on the wire and time to list product pages and add large products,
+with and without compression, against the local stub server.
+
+    $ python -m benchmarks.compression [pages] [page size]
+"""
+import sys
+import time
+
+from tiendanube.api import APIClient
+from tiendanube.hooks import TransferCounter
+from tiendanube.resources import ProductResource
+
+from .payloads import product
+from .stub_server import StubServer
+
+
+def _run(label, server, pages, page_size, **options):
+    counter = TransferCounter()
+    cli = APIClient('api_key', 'benchmark', rate_limit=False, api_endpoint=server.url,
+                    **options)
+    cli.add_listener(counter)
+    products = ProductResource(cli, '1')
+    start = time.time()
+    for page in range(1, pages + 1):
+        products.list({'page': page, 'per_page': page_size})
+    for id in range(pages):
+        products.add(product(id, variants=50, images=20))
+    elapsed = time.time() - start
+    cli.close()
+    print('{:<12} {:>8.3f}s  sent {:>9} / {:>9} bytes  received {:>9} / {:>9} bytes'.format(
+        label, elapsed, counter.request_wire_bytes, counter.request_bytes,
+        counter.response_wire_bytes, counter.response_bytes))
+
+
+def main(pages=20, page_size=200):
+    with StubServer(records=pages * page_size, compress=True) as server:
+        _run('identity', server, pages, page_size, compress_responses=False)
+        _run('compressed', server, pages, page_size, compress_threshold=1024)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
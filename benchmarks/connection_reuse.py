@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Compare a fresh connection per request against the pooled APIClient
+session, both talking to the local stub server.
+
+    $ python -m benchmarks.connection_reuse [requests]
+"""
+import sys
+import time
+
+import requests
+
+from tiendanube.api import APIClient
+from tiendanube.resources import ProductResource
+
+from .stub_server import StubServer
+
+
+def _run(label, n, call, teardown=None):
+    with StubServer() as server:
+        start = time.time()
+        for i in range(n):
+            call(server, i)
+        elapsed = time.time() - start
+        if teardown:
+            teardown()
+        print('{:<12} {:>6} requests  {:>8.3f}s  {:>8.1f} req/s  {:>6} connections'.format(
+            label, n, elapsed, n / elapsed, server.connections))
+
+
+def main(n=500):
+    def unpooled(server, i):
+        requests.get('{}/v1/1/products/{}'.format(server.url, i))
+
+    cli = APIClient('api_key', 'benchmark', rate_limit=False)
+    products = ProductResource(cli, '1')
+
+    def pooled(server, i):
+        cli.API_ENDPOINT = server.url
+        products.get(i)
+
+    _run('unpooled', n, unpooled)
+    _run('pooled', n, pooled, teardown=cli.close)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
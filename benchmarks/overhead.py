@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Client side CPU time per request, with the network replaced by a fake
+transport that answers every request with the same canned response.
+
+    $ python -m benchmarks.overhead [rounds]
+"""
+import json
+import sys
+import timeit
+
+from furl import furl
+
+from tiendanube.api import APIClient
+from tiendanube.resources import ProductResource
+
+
+class FakeResponse(object):
+    status_code = 200
+    reason = 'OK'
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+        self.text = content
+
+
+class FakeSession(object):
+
+    def __init__(self, content):
+        self.response = FakeResponse(content)
+
+    def get(self, **kwargs):
+        return self.response
+
+    post = put = get
+
+    def close(self):
+        pass
+
+
+def build_client(content, **options):
+    cli = APIClient('api_key', 'benchmark', **options)
+    cli.session = FakeSession(content)
+    return cli
+
+
+def legacy_url(store_id, *segments):
+    url = furl(APIClient.API_ENDPOINT)
+    url.path.segments = [APIClient.API_VERSION, store_id]
+    url.path.segments.extend(segments)
+    return str(url)
+
+
+def main(rounds=20000):
+    record = json.dumps({'id': 1, 'name': {'es': 'Producto'}})
+    cli = build_client(record, rate_limit=False)
+    products = ProductResource(cli, '46')
+    variants = products.get(1).variants
+
+    cases = [
+        ('furl url (before)', lambda: legacy_url('46', 'products', '1', 'variants', '2')),
+        ('route url', lambda: cli.get_route('46', 'products')),
+        ('make_request get', lambda: cli.make_request('46', 'products', resource_id='1')),
+        ('make_request list', lambda: cli.make_request('46', 'products', extra={'page': 2})),
+        ('products.get', lambda: products.get(1)),
+        ('products.list', lambda: products.list({'page': 2})),
+        ('products.update', lambda: products.update({'id': 1, 'name': {'es': 'x'}})),
+        ('variants.get', lambda: variants.get(2)),
+    ]
+    for label, fn in cases:
+        per_call = timeit.timeit(fn, number=rounds) / rounds
+        print('{:<20} {:>8.2f} us/call'.format(label, per_call * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Fake API payloads shaped like the real ones, for the benchmarks.
+"""
+
+
+def product(id, variants=5, images=3):
+    return {
+        'id': id,
+        'name': {'es': 'Producto {}'.format(id), 'pt': 'Produto {}'.format(id),
+                 'en': 'Product {}'.format(id)},
+        'description': {'es': '<p>Descripcion {}</p>'.format(id) * 5,
+                        'pt': '<p>Descricao {}</p>'.format(id) * 5},
+        'handle': {'es': 'producto-{}'.format(id), 'pt': 'produto-{}'.format(id)},
+        'published': True,
+        'free_shipping': False,
+        'created_at': '2013-01-03T09:11:51-03:00',
+        'updated_at': '2013-03-11T09:14:11-03:00',
+        'categories': [{'id': c, 'name': {'es': 'Categoria {}'.format(c)}} for c in range(2)],
+        'tags': 'remera, verano, oferta',
+        'variants': [{
+            'id': id * 100 + v,
+            'product_id': id,
+            'price': '{}.99'.format(v + 10),
+            'promotional_price': None,
+            'stock_management': True,
+            'stock': v * 3,
+            'sku': 'SKU-{}-{}'.format(id, v),
+            'weight': '0.25',
+            'values': [{'es': 'Talle {}'.format(v)}],
+            'created_at': '2013-01-03T09:11:51-03:00',
+            'updated_at': '2013-03-11T09:14:11-03:00',
+        } for v in range(variants)],
+        'images': [{
+            'id': id * 100 + i,
+            'product_id': id,
+            'src': 'http://d26lpennugtm8s.cloudfront.net/stores/001/{}-{}.jpg'.format(id, i),
+            'position': i + 1,
+            'created_at': '2013-01-03T09:11:51-03:00',
+            'updated_at': '2013-03-11T09:14:11-03:00',
+        } for i in range(images)],
+    }
+
+
+def product_page(size=200, **kwargs):
+    return [product(i, **kwargs) for i in range(1, size + 1)]
+
+
+def order(id, products=4):
+    return {
+        'id': id,
+        'number': 1000 + id,
+        'token': '{:040x}'.format(id),
+        'store_id': '1',
+        'contact_email': 'customer{}@example.com'.format(id),
+        'contact_name': 'Customer {}'.format(id),
+        'contact_phone': '+54 11 5555 {:04}'.format(id % 10000),
+        'shipping_address': 'Calle Falsa {}'.format(id),
+        'shipping_city': 'Buenos Aires',
+        'shipping_zipcode': '1425',
+        'subtotal': '{}.00'.format(products * 10),
+        'discount': '0.00',
+        'total': '{}.00'.format(products * 10 + 5),
+        'currency': 'ARS',
+        'gateway': 'mercadopago',
+        'status': 'open',
+        'payment_status': 'paid',
+        'shipping_status': 'unpacked',
+        'created_at': '2013-04-03T09:11:51-03:00',
+        'updated_at': '2013-04-11T09:14:11-03:00',
+        'customer': {'id': id * 7, 'name': 'Customer {}'.format(id),
+                     'email': 'customer{}@example.com'.format(id)},
+        'products': [{
+            'id': id * 10 + p,
+            'product_id': p,
+            'variant_id': p * 100,
+            'name': 'Producto {}'.format(p),
+            'price': '10.00',
+            'quantity': p + 1,
+            'sku': 'SKU-{}-0'.format(p),
+        } for p in range(products)],
+    }
+
+
+def order_page(size=200, **kwargs):
+    return [order(i, **kwargs) for i in range(1, size + 1)]
+
+
+def store(id):
+    return {
+        'id': int(id),
+        'name': {'es': 'Tienda {}'.format(id)},
+        'email': 'store{}@example.com'.format(id),
+        'url_with_protocol': 'http://tienda{}.mitiendanube.com'.format(id),
+        'country': 'AR',
+        'languages': {'es': {'currency': 'ARS', 'active': True}},
+        'plan_name': 'free',
+        'created_at': '2013-01-03T09:11:51-03:00',
+    }
+
+
+def customer(id):
+    return {
+        'id': id,
+        'name': 'Customer {}'.format(id),
+        'email': 'customer{}@example.com'.format(id),
+        'phone': '+54 11 5555 {:04}'.format(id % 10000),
+        'identification': '{:08}'.format(id),
+        'total_spent': '{}.00'.format(id * 3),
+        'total_spent_currency': 'ARS',
+        'last_order_id': id * 11,
+        'default_address': {
+            'address': 'Calle Falsa', 'number': str(id), 'city': 'Buenos Aires',
+            'province': 'Capital Federal', 'zipcode': '1425', 'country': 'AR',
+        },
+        'created_at': '2013-01-03T09:11:51-03:00',
+        'updated_at': '2013-03-11T09:14:11-03:00',
+    }
+
+
+def category(id):
+    return {
+        'id': id,
+        'name': {'es': 'Categoria {}'.format(id), 'pt': 'Categoria {}'.format(id)},
+        'description': {'es': 'Descripcion {}'.format(id)},
+        'handle': {'es': 'categoria-{}'.format(id)},
+        'parent': None,
+        'subcategories': [],
+        'created_at': '2013-01-03T09:11:51-03:00',
+        'updated_at': '2013-03-11T09:14:11-03:00',
+    }
+
+
+def script(id):
+    return {
+        'id': id,
+        'src': 'https://example.com/script-{}.js'.format(id),
+        'event': 'onload',
+        'where': 'store',
+        'created_at': '2013-01-03T09:11:51-03:00',
+        'updated_at': '2013-03-11T09:14:11-03:00',
+    }
+
+
+def webhook(id):
+    return {
+        'id': id,
+        'url': 'https://example.com/hooks/{}'.format(id),
+        'event': 'order/created',
+        'created_at': '2013-01-03T09:11:51-03:00',
+        'updated_at': '2013-03-11T09:14:11-03:00',
+    }
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Compare wrapping a decoded product page with bunchify against the lazy
+Result views, reading two fields of every product.
+
+    $ python -m benchmarks.results [page size] [rounds]
+"""
+import json
+import sys
+import timeit
+
+from bunch import bunchify
+
+from tiendanube.resources.results import Result, ResultList, to_result
+
+from .payloads import product_page
+
+
+def deep_size(obj, seen=None):
+    """
+    Approximate bytes held by ``obj`` and everything it references.
+    """
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (Result, ResultList)):
+        size += deep_size(obj._data, seen)
+    elif isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+def read_two_fields(products):
+    return [(p.id, p.name.es) for p in products]
+
+
+def main(size=200, rounds=20):
+    content = json.dumps(product_page(size))
+
+    for label, wrap in (('bunchify', bunchify), ('lazy', to_result)):
+        decoded = json.loads(content)
+        seen = set()
+        decoded_size = deep_size(decoded, seen)
+        # While wrapping, the decoded page and what wrap built on top of it
+        # are both alive.
+        peak = decoded_size + deep_size(wrap(decoded), seen)
+        elapsed = timeit.timeit(lambda: read_two_fields(wrap(json.loads(content))),
+                                number=rounds) / rounds
+        print('{:<10} {:>8.2f} ms/page  {:>10} bytes peak'.format(
+            label, elapsed * 1000, peak))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
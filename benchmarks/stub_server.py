@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for the Tiendanube v1 API, used by the benchmarks.
+
+It serves the store, products (with variants and images), orders,
+customers, categories, scripts and webhooks of any store id. Records
+are generated from their id, so any id can be fetched, and every
+resource lists ``records`` of them, paginated with ``page`` and
+``per_page`` like the real API (404 past the last page).
+
+It speaks HTTP/1.1 so clients can keep connections alive, and counts how
+many TCP connections it accepted so connection reuse can be measured.
+``latency`` adds that many seconds to every response, and ``rate_limit``,
+a ``(limit, leak_rate)`` pair, enables a leaky bucket per store that
+answers 429 when full and sends the ``x-rate-limit-*`` headers. With
+``compress`` responses are gzipped for clients accepting it; gzipped
+request bodies are always understood.
+"""
+import json
+import threading
+import time
+import zlib
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs, urlparse
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+
+from . import payloads
+
+
+def _generators(server):
+    return {
+        'products': lambda id: payloads.product(id, variants=server.variants,
+                                                images=server.images),
+        'orders': lambda id: payloads.order(id, products=server.order_products),
+        'customers': payloads.customer,
+        'categories': payloads.category,
+        'scripts': payloads.script,
+        'webhooks': payloads.webhook,
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.count_connection()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        gzipped = self.server.compress and 'gzip' in (self.headers.get('Accept-Encoding') or '')
+        if gzipped:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            data = compressor.compress(data) + compressor.flush()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        data = self.rfile.read(length)
+        if self.headers.get('Content-Encoding') == 'gzip':
+            data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        return json.loads(data.decode('utf-8'))
+
+    def _route(self):
+        """
+        Parse the path into (store_id, resource, resource_id, subresource,
+        subresource_id, query), answering errors itself and returning None.
+        """
+        url = urlparse(self.path)
+        path = url.path.strip('/').split('/')
+        if len(path) < 3 or path[0] != 'v1':
+            self._reply(404, {'code': 404, 'message': 'Not Found'})
+            return None
+        store_id = path[1]
+        rate_limit_headers = self.server.take_rate_limit(store_id)
+        if rate_limit_headers is None:
+            self._reply(429, {'code': 429, 'message': 'Too Many Requests'},
+                        self.server.rate_limit_headers(store_id))
+            return None
+        self._rate_limit_headers = rate_limit_headers
+        path = path[2:] + [None] * (6 - len(path))
+        return [store_id] + path[:4] + [parse_qs(url.query)]
+
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            return
+        store_id, resource, resource_id, subresource, subresource_id, query = route
+        if resource == 'store':
+            return self._reply(200, payloads.store(store_id), self._rate_limit_headers)
+
+        generators = _generators(self.server)
+        if resource not in generators:
+            return self._reply(404, {'code': 404, 'message': 'Not Found'})
+        if resource_id is None:
+            return self._list(generators[resource], query)
+
+        record = generators[resource](int(resource_id))
+        if subresource is None:
+            return self._reply(200, record, self._rate_limit_headers)
+        items = record.get(subresource)
+        if items is None:
+            return self._reply(404, {'code': 404, 'message': 'Not Found'})
+        if subresource_id is None:
+            return self._reply(200, items, self._rate_limit_headers)
+        matches = [i for i in items if str(i['id']) == subresource_id]
+        if not matches:
+            return self._reply(404, {'code': 404, 'message': 'Not Found'})
+        self._reply(200, matches[0], self._rate_limit_headers)
+
+    def _list(self, generator, query):
+        page = int(query.get('page', ['1'])[0])
+        per_page = int(query.get('per_page', [self.server.page_size])[0])
+        first = (page - 1) * per_page + 1
+        if first > self.server.records and page > 1:
+            return self._reply(404, {'code': 404, 'message': 'Last page is {}'.format(
+                max(1, (self.server.records + per_page - 1) // per_page))})
+        last = min(first + per_page - 1, self.server.records)
+        self._reply(200, [generator(id) for id in range(first, last + 1)],
+                    self._rate_limit_headers)
+
+    def do_POST(self):
+        route = self._route()
+        if route is None:
+            return
+        body = self._read_body()
+        body.setdefault('id', self.server.next_id())
+        self._reply(201, body, self._rate_limit_headers)
+
+    def do_PUT(self):
+        route = self._route()
+        if route is None:
+            return
+        self._reply(200, self._read_body(), self._rate_limit_headers)
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, port=0, records=1000, page_size=30, latency=0,
+                 rate_limit=None, variants=5, images=3, order_products=4, compress=False):
+        HTTPServer.__init__(self, ('127.0.0.1', port), StubHandler)
+        self.records = records
+        self.page_size = page_size
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.variants = variants
+        self.images = images
+        self.order_products = order_products
+        self.compress = compress
+        self.connections = 0
+        self._buckets = {}
+        self._last_id = records
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def next_id(self):
+        with self._lock:
+            self._last_id += 1
+            return self._last_id
+
+    def _leak(self, store_id):
+        level, updated_at = self._buckets.get(store_id, (0.0, time.time()))
+        now = time.time()
+        level = max(0.0, level - (now - updated_at) * self.rate_limit[1])
+        self._buckets[store_id] = (level, now)
+        return level
+
+    def rate_limit_headers(self, store_id):
+        limit, leak_rate = self.rate_limit
+        with self._lock:
+            level = self._leak(store_id)
+        return {
+            'x-rate-limit-limit': limit,
+            'x-rate-limit-remaining': int(limit - level),
+            'x-rate-limit-reset': int(level / leak_rate * 1000),
+        }
+
+    def take_rate_limit(self, store_id):
+        """
+        Headers to answer with, or None if the bucket of the store is full.
+        """
+        if not self.rate_limit:
+            return {}
+        with self._lock:
+            level = self._leak(store_id)
+            if level + 1 > self.rate_limit[0]:
+                return None
+            self._buckets[store_id] = (level + 1, time.time())
+        return self.rate_limit_headers(store_id)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
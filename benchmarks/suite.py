@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput, p50/p99 latency and peak memory of get, list, add, update
+and pagination workloads against the local stub server, for every client
+mode. Pagination latencies are per page. Every mode runs in its own process, so its peak memory is its own.
+
+    $ python -m benchmarks.suite --latency 0.002 --records 2000 --ops 300
+"""
+import argparse
+import multiprocessing
+import resource
+from timeit import default_timer
+
+from tiendanube.client import AsyncNubeClient, NubeClient
+from tiendanube.resources.results import RAW, Tuples
+
+from .stub_server import StubServer
+
+
+MODES = ['result', 'raw', 'tuples', 'async']
+RESULT_MODES = {
+    'result': None,
+    'raw': RAW,
+    'tuples': Tuples(['id', 'updated_at']),
+    'async': None,
+}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[int(round(p / 100.0 * (len(values) - 1)))]
+
+
+def _workloads(store, mode, args):
+    result_mode = RESULT_MODES[mode]
+    pages = max(1, args.records // args.per_page)
+    product = {'name': {'es': 'Producto'}, 'variants': [{'price': '10.00'}]}
+    return [
+        ('get', [lambda i=i: store.products.get(i % args.records + 1, mode=result_mode)
+                 for i in range(args.ops)]),
+        ('list', [lambda i=i: store.products.list({'page': i % pages + 1,
+                                                   'per_page': args.per_page},
+                                                  mode=result_mode)
+                  for i in range(args.ops // 10 or 1)]),
+        ('add', [lambda: store.products.add(product) for _ in range(args.ops)]),
+        ('update', [lambda i=i: store.products.update(dict(product, id=i + 1))
+                    for i in range(args.ops)]),
+    ]
+
+
+def _run_sync(calls):
+    latencies = []
+    start = default_timer()
+    for call in calls:
+        call_start = default_timer()
+        call()
+        latencies.append(default_timer() - call_start)
+    return default_timer() - start, latencies
+
+
+def _run_async(calls):
+    latencies = []
+    start = default_timer()
+    futures = []
+    for call in calls:
+        call_start = default_timer()
+        future = call()
+        future.add_done_callback(
+            lambda f, call_start=call_start: latencies.append(default_timer() - call_start))
+        futures.append(future)
+    for future in futures:
+        future.result()
+    return default_timer() - start, latencies
+
+
+def _paginate_sync(resource, per_page, mode):
+    # The latency of a page is how long the caller waited for its records.
+    latencies = []
+    records = 0
+    start = page_start = default_timer()
+    for _ in resource.iter_all(per_page=per_page, mode=mode):
+        records += 1
+        if records % per_page == 0:
+            now = default_timer()
+            latencies.append(now - page_start)
+            page_start = now
+    if records % per_page or not records:
+        latencies.append(default_timer() - page_start)
+    return default_timer() - start, records, latencies
+
+
+def _paginate_async(resource, per_page, mode):
+    latencies = []
+    records = 0
+    start = default_timer()
+    page = 1
+    while page:
+        page_start = default_timer()
+        items, page = resource.get_page(page, per_page=per_page, mode=mode).result()
+        latencies.append(default_timer() - page_start)
+        records += len(items)
+    return default_timer() - start, records, latencies
+
+
+def run_mode(mode, url, args, results):
+    options = {'api_endpoint': url, 'rate_limit': bool(args.rate_limit)}
+    if mode == 'async':
+        client = AsyncNubeClient('api_key', 'benchmark', max_workers=args.workers, **options)
+        run, paginate = _run_async, _paginate_async
+    else:
+        client = NubeClient('api_key', 'benchmark', **options)
+        run, paginate = _run_sync, _paginate_sync
+    store = client.get_store(1)
+
+    rows = []
+    for name, calls in _workloads(store, mode, args):
+        elapsed, latencies = run(calls)
+        rows.append((name, len(calls), len(calls) / elapsed, percentile(latencies, 50),
+                     percentile(latencies, 99)))
+
+    elapsed, records, latencies = paginate(store.orders, args.per_page, RESULT_MODES[mode])
+    rows.append(('paginate', records, records / elapsed, percentile(latencies, 50),
+                 percentile(latencies, 99)))
+    if mode == 'async':
+        client.close()
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    results.put((mode, rows, peak_mb))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--ops', type=int, default=200, help='calls per workload')
+    parser.add_argument('--records', type=int, default=1000, help='records per resource')
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per response')
+    parser.add_argument('--variants', type=int, default=5)
+    parser.add_argument('--images', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=20, help='async mode workers')
+    parser.add_argument('--rate-limit', default=None, help='limit,leak_rate e.g. 40,2')
+    args = parser.parse_args(argv)
+    rate_limit = None
+    if args.rate_limit:
+        limit, leak_rate = args.rate_limit.split(',')
+        rate_limit = (int(limit), float(leak_rate))
+
+    print('{:<8} {:<9} {:>6} {:>10} {:>9} {:>9} {:>9}'.format(
+        'mode', 'workload', 'ops', 'ops/s', 'p50 ms', 'p99 ms', 'peak MB'))
+    with StubServer(records=args.records, latency=args.latency, rate_limit=rate_limit,
+                    variants=args.variants, images=args.images) as server:
+        for mode in args.modes.split(','):
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run_mode,
+                                              args=(mode, server.url, args, results))
+            process.start()
+            mode, rows, peak_mb = results.get()
+            process.join()
+            for name, ops, throughput, p50, p99 in rows:
+                print('{:<8} {:<9} {:>6} {:>10.1f} {:>9.2f} {:>9.2f} {:>9.1f}'.format(
+                    mode, name, ops, throughput, p50 * 1000, p99 * 1000, peak_mb))
+
+
+if __name__ == '__main__':
+    main()
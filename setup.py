@@ -26,6 +26,7 @@ setup(
         "argparse==1.2.1",
         "bunch==1.0.1",
         "furl==0.3.4",
+        "futures==3.3.0; python_version < '3'",
         "ipython==1.0.0",
         "mock==1.0.1",
         "orderedmultidict==0.7.1",
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from mock import Mock, patch
+
+from tiendanube.api import APIClient
+from tiendanube.client import NubeClient
+
+
+class APIClientSessionTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_single_session_per_client(self, requests_mock):
+        cli = APIClient('test_api_key', 'test user agent')
+
+        self.assertEqual(1, requests_mock.Session.call_count)
+        self.assertEqual(requests_mock.Session.return_value, cli.session)
+
+    @patch('tiendanube.api.requests')
+    def test_pool_settings(self, requests_mock):
+        APIClient('test_api_key', 'test user agent', pool_connections=3,
+                  pool_maxsize=25, pool_block=True)
+
+        mount = requests_mock.Session.return_value.mount
+        self.assertEqual(2, mount.call_count)
+        adapter = mount.call_args[0][1]
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(25, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    @patch('tiendanube.api.requests')
+    def test_no_keep_alive(self, requests_mock):
+        cli = APIClient('test_api_key', 'test user agent', keep_alive=False)
+
+        self.assertEqual('close', cli.headers['Connection'])
+
+    @patch('tiendanube.api.requests')
+    def test_stores_share_session(self, requests_mock):
+        response_mock = Mock()
+        response_mock.status_code = 200
+        response_mock.content = json.dumps({'id': 46})
+        requests_mock.Session.return_value.get.return_value = response_mock
+        client = NubeClient('test_api_key')
+
+        client.get_store(46).products.get(1)
+        client.get_store(47).orders.get(2)
+
+        self.assertEqual(1, requests_mock.Session.call_count)
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
+
+
+class APIClientRouteTest(unittest.TestCase):
+
+    def test_route(self):
+        cli = APIClient('test_api_key', 'test user agent')
+
+        self.assertEqual('https://api.tiendanube.com/v1/46/products',
+                         cli.get_route('46', 'products'))
+        self.assertEqual('https://api.tiendanube.com/v1/46',
+                         cli.get_route('46', None))
+
+    @patch('tiendanube.api.furl')
+    def test_route_built_once(self, furl_mock):
+        furl_mock.return_value.__str__ = Mock(return_value='route')
+        cli = APIClient('test_api_key', 'test user agent')
+
+        for _ in range(3):
+            cli.get_route('46', 'products')
+
+        self.assertEqual(1, furl_mock.call_count)
+
+    def test_max_routes(self):
+        cli = APIClient('test_api_key', 'test user agent')
+        cli.MAX_ROUTES = 2
+        for store_id in ('1', '2', '3'):
+            cli.get_route(store_id, 'products')
+
+        self.assertEqual(1, len(cli._routes))
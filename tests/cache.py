@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import time
+import unittest
+
+from mock import patch
+
+from tiendanube.api import APIClient
+from tiendanube.cache import ResponseCache
+from tiendanube.resources import CategoryResource, ProductResource, StoreResource
+
+from .helpers import response
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set('a', '46', 'products', response())
+        cache.set('b', '46', 'products', response())
+        cache.get('a')
+        cache.set('c', '46', 'products', response())
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(None, cache.get('b'))
+        self.assertNotEqual(None, cache.get('a'))
+
+    def test_per_resource_ttl(self):
+        cache = ResponseCache(ttl=60, ttls={'store': 0})
+        cache.set('a', '46', 'store', response())
+        cache.set('b', '46', 'products', response())
+
+        self.assertFalse(cache.get('a').is_fresh())
+        self.assertTrue(cache.get('b').is_fresh())
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.set('a', '46', 'store', response())
+        cache.set('b', '46', 'products', response())
+        cache.set('c', '47', 'products', response())
+        cache.invalidate('46', 'products')
+
+        self.assertEqual(None, cache.get('b'))
+        self.assertEqual(2, len(cache))
+
+
+class APIClientCacheTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_fresh_hit(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 1})
+        cli = APIClient('test_api_key', 'test user agent', cache=ResponseCache())
+        p = ProductResource(cli, '46')
+
+        self.assertEqual(p.list(), p.list())
+        p.list(filters={'page': 2})
+
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_etag_revalidation(self, requests_mock):
+        get = requests_mock.Session.return_value.get
+        get.side_effect = [
+            response({'id': 46, 'name': 'store'}, headers={'ETag': '"v1"'}),
+            response(status_code=304),
+        ]
+        cli = APIClient('test_api_key', 'test user agent', cache=ResponseCache(ttl=0))
+        s = StoreResource(cli, '46')
+
+        s.get()
+        res = s.get()
+
+        self.assertEqual('store', res.name)
+        self.assertEqual('"v1"', get.call_args[1]['headers']['If-None-Match'])
+        self.assertFalse('If-None-Match' in cli.headers)
+
+    @patch('tiendanube.api.requests')
+    def test_stale_while_revalidate(self, requests_mock):
+        get = requests_mock.Session.return_value.get
+        get.side_effect = [
+            response([{'id': 1}]),
+            response([{'id': 2}]),
+        ]
+        cli = APIClient('test_api_key', 'test user agent',
+                        cache=ResponseCache(ttl=0, stale_ttl=60))
+        c = CategoryResource(cli, '46')
+
+        c.list()
+        self.assertEqual(1, c.list()[0].id)
+        for _ in range(100):
+            if get.call_count == 2 and not cli.cache._refreshing:
+                break
+            time.sleep(0.01)
+        self.assertEqual(2, c.list()[0].id)
+
+    @patch('tiendanube.api.requests')
+    def test_writes_invalidate(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 1})
+        requests_mock.Session.return_value.put.return_value = response({'id': 1})
+        cli = APIClient('test_api_key', 'test user agent', cache=ResponseCache())
+        p = ProductResource(cli, '46')
+
+        p.get(1)
+        p.update({'id': 1, 'name': 'new'})
+        p.get(1)
+
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
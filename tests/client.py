@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+
+from bunch import bunchify
+from mock import patch
+
+from tiendanube.client import AsyncNubeClient, NubeClient
+from tiendanube.concurrency import Future
+from tiendanube.resources.asynchronous import AsyncListSubResource
+from tiendanube.resources.exceptions import APIError
+from tiendanube.resources.results import Lazy
+
+from .helpers import response
+
+
+class NubeClientStoreTest(unittest.TestCase):
+
+    def test_store_handles_cached(self):
+        client = NubeClient('test_api_key')
+
+        store = client.get_store(46)
+
+        self.assertTrue(client.get_store(46) is store)
+        self.assertTrue(client.get_store('46') is store)
+        self.assertFalse(client.get_store(47) is store)
+        self.assertEqual('46', store.store_id)
+
+    def test_store_handles_bounded(self):
+        client = NubeClient('test_api_key')
+        client.MAX_STORES = 2
+        first = client.get_store(1)
+        second = client.get_store(2)
+        client.get_store(1)
+
+        client.get_store(3)
+
+        self.assertTrue(client.get_store(1) is first)
+        self.assertFalse(client.get_store(2) is second)
+
+    def test_resources_built_lazily(self):
+        store = NubeClient('test_api_key').get_store(46)
+        self.assertFalse(hasattr(store, '__dict__'))
+        self.assertRaises(AttributeError, getattr, store, '_products')
+
+        products = store.products
+
+        self.assertTrue(store.products is products)
+        self.assertEqual('46', products.store_id)
+        self.assertRaises(AttributeError, getattr, store, '_orders')
+
+
+class AsyncNubeClientTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_get_returns_future(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 991})
+        client = AsyncNubeClient('test_api_key', 'test user agent', max_workers=2)
+
+        res = client.get_store(46).products.get(991)
+
+        self.assertTrue(isinstance(res, Future))
+        self.assertEqual(991, res.result().id)
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products/991',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params=None
+        )
+        client.close()
+
+    @patch('tiendanube.api.requests')
+    def test_many_in_flight(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response([{'id': 1}])
+        client = AsyncNubeClient('test_api_key', 'test user agent', max_workers=8)
+
+        futures = [client.get_store(s).orders.list() for s in range(50)]
+
+        self.assertEqual([[{'id': 1}]] * 50, [f.result() for f in futures])
+        client.close()
+
+    @patch('tiendanube.api.requests')
+    def test_get_page(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response([{'id': 1}, {'id': 2}]),
+            response([{'id': 3}]),
+        ]
+        client = AsyncNubeClient('test_api_key', 'test user agent', max_workers=2)
+        products = client.get_store(46).products
+
+        first = products.get_page(per_page=2)
+        self.assertTrue(isinstance(first, Future))
+        records, next_page = first.result()
+        self.assertEqual([{'id': 1}, {'id': 2}], records)
+        self.assertEqual(2, next_page)
+        self.assertEqual(([{'id': 3}], None), products.get_page(next_page, per_page=2).result())
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params={'page': 2, 'per_page': 2}
+        )
+        self.assertRaises(ValueError, products.get_page, per_page=500)
+        client.close()
+
+    @patch('tiendanube.api.requests')
+    def test_errors(self, requests_mock):
+        requests_mock.Session.return_value.post.return_value = response({}, status_code=422)
+        client = AsyncNubeClient('test_api_key', 'test user agent')
+
+        res = client.get_store(46).customers.add({'name': 'x'})
+
+        self.assertRaises(APIError, res.result)
+        self.assertEqual(422, res.exception().code)
+        client.close()
+
+    @patch('tiendanube.api.requests')
+    def test_async_subresources(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 991})
+        client = AsyncNubeClient('test_api_key', 'test user agent')
+        p = client.get_store(46).products.get(991).result()
+        self.assertTrue(isinstance(p._attached['images'], Lazy))
+
+        requests_mock.Session.return_value.get.return_value = response([{'id': 1}])
+        res = p.images.list()
+
+        self.assertTrue(isinstance(p.images, AsyncListSubResource))
+
+        self.assertEqual(bunchify([{'id': 1}]), res.result())
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products/991/images',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params=None
+        )
+        client.close()
+
+
+class MapStoresTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_map_stores(self, requests_mock):
+        def get(url, headers, params):
+            store_id = url.split('/')[4]
+            if store_id == '13':
+                return response({}, status_code=401)
+            return response({'id': int(store_id)})
+        requests_mock.Session.return_value.get.side_effect = get
+        client = NubeClient('test_api_key', 'test user agent')
+
+        res = list(client.map_stores(range(1, 31), lambda s: s.get_info(), concurrency=5))
+
+        self.assertEqual(30, len(res))
+        by_store = dict((r.store_id, r) for r in res)
+        self.assertEqual(401, by_store[13].error.code)
+        self.assertEqual(None, by_store[13].result)
+        self.assertEqual(set(range(1, 31)) - set([13]),
+                         set(r.result.id for r in res if r.error is None))
+
+    @patch('tiendanube.api.requests')
+    def test_map_stores_per_store_concurrency(self, requests_mock):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def get(url, headers, params):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.005)
+            with lock:
+                state['running'] -= 1
+            return response({'id': 1})
+        requests_mock.Session.return_value.get.side_effect = get
+        client = NubeClient('test_api_key', 'test user agent')
+
+        res = list(client.map_stores(
+            [46], lambda s: s.orders.get_many(range(20), max_workers=10),
+            per_store_concurrency=2
+        ))
+
+        self.assertEqual(None, res[0].error)
+        self.assertEqual(20, len(res[0].result))
+        self.assertEqual(2, state['max'])
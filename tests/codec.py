@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from mock import Mock, patch
+
+from tiendanube.api import APIClient
+from tiendanube.codec import JSONCodec
+from tiendanube.resources import OrderResource, ProductResource
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def test_decode_bytes(self):
+        codec = JSONCodec()
+
+        self.assertEqual({u'name': u'caf\xe9'},
+                         codec.decode(u'{"name": "caf\xe9"}'.encode('utf-8')))
+
+    def test_encode_stdlib(self):
+        self.assertEqual(json.dumps({'id': 1}), JSONCodec().encode({'id': 1}))
+
+    def test_stdlib_fallback(self):
+        self.assertTrue(JSONCodec(loads=json.loads).loads is json.loads)
+
+    def test_iter_decode(self):
+        records = [{'name': 'a, ] } "quoted" \\', 'tags': [1, {'x': None}]}, 2, 'three', [], {}]
+        body = json.dumps(records).encode('utf-8')
+
+        for size in (1, 2, 5, 64):
+            chunks = [body[i:i + size] for i in range(0, len(body), size)]
+            self.assertEqual(records, list(JSONCodec().iter_decode(chunks)))
+        self.assertEqual([], list(JSONCodec().iter_decode([b' [ ] '])))
+        self.assertRaises(ValueError, list, JSONCodec().iter_decode([b'[1, 2']))
+        self.assertRaises(ValueError, list, JSONCodec().iter_decode([b'{"code": 404}']))
+
+
+class APIClientCodecTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_custom_codec(self, requests_mock):
+        response_mock = Mock()
+        response_mock.status_code = 201
+        response_mock.content = b'{"id": 1}'
+        requests_mock.Session.return_value.post.return_value = response_mock
+        codec = JSONCodec(loads=Mock(return_value={'id': 1}), dumps=Mock(return_value='{}'))
+        cli = APIClient('test_api_key', 'test user agent', codec=codec)
+
+        res = OrderResource(cli, '46').add({'id': 1})
+
+        self.assertEqual(1, res.id)
+        codec.loads.assert_called_with(b'{"id": 1}')
+        codec.dumps.assert_called_with({'id': 1})
+        self.assertEqual('{}', requests_mock.Session.return_value.post.call_args[1]['data'])
+
+    @patch('tiendanube.api.requests')
+    def test_encode_results(self, requests_mock):
+        session = requests_mock.Session.return_value
+        for verb in (session.get, session.post, session.put):
+            verb.return_value.status_code = 200
+            verb.return_value.content = json.dumps({'id': 1, 'name': {'es': 'x'}, 'tags': ['a']})
+        cli = APIClient('test_api_key', 'test user agent')
+        products = ProductResource(cli, '46')
+        product = products.get(1)
+
+        products.add(product)
+        products.update({'id': 2, 'name': product.name, 'tags': product.tags})
+
+        self.assertEqual({'id': 1, 'name': {'es': 'x'}, 'tags': ['a']},
+                         json.loads(session.post.call_args[1]['data']))
+        self.assertEqual({'id': 2, 'name': {'es': 'x'}, 'tags': ['a']},
+                         json.loads(session.put.call_args[1]['data']))
+        self.assertRaises(TypeError, JSONCodec().encode, {'id': object()})
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+from concurrent.futures import wait
+
+from tiendanube.concurrency import Future, WorkerPool, run_in_thread
+
+
+class FutureTest(unittest.TestCase):
+
+    def test_result(self):
+        f = Future()
+        f.set_result(3)
+
+        self.assertTrue(f.done())
+        self.assertEqual(3, f.result())
+        self.assertEqual(None, f.exception())
+
+    def test_exception(self):
+        f = Future()
+        f.set_exception(ValueError('boom'))
+
+        self.assertRaises(ValueError, f.result)
+        self.assertTrue(isinstance(f.exception(), ValueError))
+
+    def test_callbacks(self):
+        seen = []
+        f = Future()
+        f.add_done_callback(lambda fut: seen.append(fut.result()))
+        f.set_result(1)
+        f.add_done_callback(lambda fut: seen.append(fut.result() + 1))
+
+        self.assertEqual([1, 2], seen)
+
+    def test_wait(self):
+        futures = [run_in_thread(lambda x: x * 2, x) for x in range(3)]
+
+        done, not_done = wait(futures)
+
+        self.assertEqual(set([0, 2, 4]), set(f.result() for f in done))
+        self.assertEqual(set(), not_done)
+
+    def test_run_in_thread(self):
+        self.assertEqual(4, run_in_thread(lambda x: x * 2, 2).result())
+
+
+class WorkerPoolTest(unittest.TestCase):
+
+    def test_map_keeps_order(self):
+        with WorkerPool(4) as pool:
+            self.assertEqual([0, 2, 4, 6, 8], pool.map(lambda x: x * 2, range(5)))
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+        release = threading.Event()
+
+        def work(_):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            release.wait(0.01)
+            with lock:
+                state['running'] -= 1
+
+        with WorkerPool(3) as pool:
+            pool.map(work, range(20))
+
+        self.assertEqual(3, state['max'])
+
+    def test_cancel_queued(self):
+        release = threading.Event()
+        calls = []
+
+        with WorkerPool(1) as pool:
+            pool.submit(release.wait)
+            queued = pool.submit(calls.append, 1)
+
+            self.assertTrue(queued.cancel())
+            release.set()
+
+        self.assertTrue(queued.cancelled())
+        self.assertEqual([], calls)
+
+    def test_errors_stay_in_futures(self):
+        def fail():
+            raise KeyError('x')
+
+        with WorkerPool(1) as pool:
+            failed = pool.submit(fail)
+            ok = pool.submit(lambda: 'ok')
+
+            self.assertRaises(KeyError, failed.result)
+            self.assertEqual('ok', ok.result())
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import json
+
+from mock import Mock
+
+
+def response(body=None, status_code=200, headers=None):
+    """
+    A mock of a ``requests`` response with ``body`` encoded as JSON.
+    """
+    content = json.dumps({} if body is None else body)
+    response_mock = Mock()
+    response_mock.status_code = status_code
+    response_mock.reason = 'OK' if status_code < 400 else 'Error'
+    response_mock.content = content
+    response_mock.text = content
+    response_mock.headers = headers or {}
+    return response_mock
+
+
+def stream_response(body, chunk_size=5):
+    """
+    Like ``response``, with the body also readable with ``iter_content``
+    in chunks of ``chunk_size``.
+    """
+    response_mock = response(body)
+    content = response_mock.content
+    response_mock.iter_content.side_effect = lambda size: iter(
+        [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)])
+    return response_mock
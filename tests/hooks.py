@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import unittest
+import zlib
+
+from mock import Mock, patch
+from requests.exceptions import ConnectionError
+
+from tiendanube.api import APIClient
+from tiendanube.hooks import (RequestFinished, RequestStarted, TransferCounter,
+                              log_requests)
+from tiendanube.resources import ProductResource
+from tiendanube.retry import RetryEvent, RetryPolicy
+
+from .helpers import response
+
+
+class APIClientHooksTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_request_events(self, requests_mock):
+        requests_mock.Session.return_value.post.return_value = response({'id': 1}, 201)
+        events = []
+        cli = APIClient('test_api_key', 'test user agent')
+        cli.add_listener(events.append)
+
+        ProductResource(cli, '46').add({'name': 'x'})
+
+        started, finished = events
+        self.assertEqual(RequestStarted('46', 'products', 'post',
+                                        'https://api.tiendanube.com/v1/46/products'), started)
+        self.assertTrue(isinstance(finished, RequestFinished))
+        self.assertEqual(201, finished.status_code)
+        self.assertEqual(len(json.dumps({'name': 'x'})), finished.request_bytes)
+        self.assertEqual(len(json.dumps({'id': 1})), finished.response_bytes)
+        self.assertEqual(0, finished.retries)
+        self.assertTrue(finished.elapsed >= 0)
+
+    @patch('tiendanube.api.time')
+    @patch('tiendanube.api.requests')
+    def test_retries_and_errors(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.get.side_effect = ConnectionError('reset')
+        events = []
+        cli = APIClient('test_api_key', 'test user agent',
+                        retry_policy=RetryPolicy(max_attempts=3))
+        cli.add_listener(events.append)
+
+        self.assertRaises(ConnectionError, ProductResource(cli, '46').get, 1)
+
+        self.assertEqual([RequestStarted, RetryEvent, RetryEvent, RequestFinished],
+                         [type(e) for e in events])
+        self.assertEqual(2, events[-1].retries)
+        self.assertEqual(None, events[-1].status_code)
+        self.assertTrue(isinstance(events[-1].error, ConnectionError))
+
+    @patch('tiendanube.api.requests')
+    def test_log_requests(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 1})
+        logger = Mock()
+        logger.isEnabledFor.return_value = True
+        cli = APIClient('test_api_key', 'test user agent')
+        cli.add_listener(log_requests(logger))
+
+        ProductResource(cli, '46').get(1)
+
+        self.assertEqual(1, logger.log.call_count)
+        self.assertEqual(logging.DEBUG, logger.log.call_args[0][0])
+
+    @patch('tiendanube.api.requests')
+    def test_remove_listener(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response({'id': 1})
+        listener = Mock()
+        cli = APIClient('test_api_key', 'test user agent')
+        cli.add_listener(listener)
+        cli.remove_listener(listener)
+
+        ProductResource(cli, '46').get(1)
+
+        self.assertFalse(listener.called)
+
+    @patch('tiendanube.api.requests')
+    def test_compressed_transfer(self, requests_mock):
+        session = requests_mock.Session.return_value
+        session.post.return_value = response({'id': 1}, 201, headers={'Content-Length': '9'})
+        counter = TransferCounter()
+        cli = APIClient('test_api_key', 'test user agent', compress_threshold=100)
+        cli.add_listener(counter)
+        products = ProductResource(cli, '46')
+
+        products.add({'name': 'x'})
+        products.add({'name': 'x' * 1000})
+
+        session.headers.update.assert_called_with({'Accept-Encoding': 'gzip, deflate'})
+        small, big = session.post.call_args_list
+        self.assertFalse('Content-Encoding' in small[1]['headers'])
+        self.assertEqual('gzip', big[1]['headers']['Content-Encoding'])
+        self.assertEqual(json.dumps({'name': 'x' * 1000}),
+                         zlib.decompress(big[1]['data'], 16 + zlib.MAX_WBITS))
+        self.assertEqual(2, counter.requests)
+        self.assertEqual(len(json.dumps({'name': 'x'})) + len(json.dumps({'name': 'x' * 1000})),
+                         counter.request_bytes)
+        self.assertEqual(len(json.dumps({'name': 'x'})) + len(big[1]['data']),
+                         counter.request_wire_bytes)
+        self.assertEqual(18, counter.response_wire_bytes)
+        self.assertEqual(2 * len(json.dumps({'id': 1})), counter.response_bytes)
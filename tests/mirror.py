@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import datetime
+import unittest
+
+from mock import patch
+
+from tiendanube.api import APIClient
+from tiendanube.mirror import Mirror
+from tiendanube.resources import OrderResource, ProductResource
+from tiendanube.resources.results import RAW, Tuples
+
+from .helpers import response
+
+
+class MirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mirror = Mirror(':memory:')
+        api_client = APIClient('test_api_key', 'test user agent')
+        self.orders = OrderResource(api_client, '46')
+        self.products = ProductResource(api_client, '46')
+        self.mirror.upsert(self.orders, [
+            {'id': 1, 'status': 'open', 'contact_email': 'a@example.com',
+             'updated_at': '2013-03-11T09:00:00-03:00'},
+            {'id': 2, 'status': 'closed', 'customer': {'email': 'b@example.com'},
+             'updated_at': '2013-03-12T09:00:00-03:00'},
+            {'id': 3, 'status': 'open', 'contact_email': 'b@example.com',
+             'updated_at': '2013-03-13T09:00:00-03:00'},
+        ])
+
+    def tearDown(self):
+        self.mirror.close()
+
+    def test_query(self):
+        self.assertEqual([1, 3], [r.id for r in self.mirror.query(self.orders, status='open')])
+        self.assertEqual([2, 3], [r.id for r in self.mirror.query(self.orders, email='b@example.com')])
+        self.assertEqual([3], [r.id for r in self.mirror.query(
+            self.orders, status='open', updated_at_min=datetime.datetime(2013, 3, 12))])
+        self.assertEqual([1, 2], [r.id for r in self.mirror.query(
+            self.orders, updated_at_max='2013-03-12T12:00:00Z')])
+        self.assertEqual([2], [r.id for r in self.mirror.query(
+            self.orders, ids=[3, 2], order_by='updated_at', limit=1)])
+        self.assertEqual([], self.mirror.query(self.products))
+
+    def test_results_match_the_client(self):
+        order = self.mirror.get(self.orders, 2)
+
+        self.assertEqual('b@example.com', order.customer.email)
+        self.assertEqual((2, 'closed'),
+                         tuple(self.mirror.get(self.orders, 2, mode=Tuples(['id', 'status']))))
+        self.assertEqual(1, self.mirror.get(self.orders, 1, mode=RAW)['id'])
+        self.assertEqual(None, self.mirror.get(self.orders, 4))
+
+    def test_upsert_replaces_records_and_skus(self):
+        self.mirror.upsert(self.products, [
+            {'id': 7, 'variants': [{'id': 1, 'sku': 'A-1'}, {'id': 2, 'sku': 'A-2'}]}])
+        self.assertEqual([7], [p.id for p in self.mirror.query(self.products, sku='A-2')])
+
+        self.mirror.upsert(self.products, [{'id': 7, 'variants': [{'id': 1, 'sku': 'B-1'}]}])
+
+        self.assertEqual([], self.mirror.query(self.products, sku='A-2'))
+        self.assertEqual([7], [p.id for p in self.mirror.query(self.products, sku='B-1')])
+        self.assertEqual(1, self.mirror.count(self.products))
+
+    def test_delete(self):
+        self.mirror.delete(self.orders, [1, 2])
+
+        self.assertEqual([3], [r.id for r in self.mirror.query(self.orders)])
+
+    @patch('tiendanube.api.requests')
+    def test_pull(self, requests_mock):
+        get = requests_mock.Session.return_value.get
+        get.side_effect = [response([{'id': 4, 'status': 'open'}, {'id': 1, 'status': 'closed'}]),
+                           response([])]
+        orders = OrderResource(APIClient('test_api_key', 'test user agent'), '46')
+
+        self.assertEqual(2, self.mirror.pull(orders, per_page=2, batch_size=1))
+        self.assertEqual([1, 2], [r.id for r in self.mirror.query(self.orders, status='closed')])
+        self.assertEqual(4, self.mirror.count(self.orders))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from mock import Mock, patch
+
+from tiendanube.api import APIClient
+from tiendanube.profiling import Profiler
+from tiendanube.resources import ProductResource
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_summary(self):
+        profiler = Profiler()
+        profiler.samples = [('network', 0.2), ('decode', 0.01), ('network', 0.4)]
+
+        summary = profiler.summary()
+
+        self.assertEqual(['network', 'decode'], list(summary.keys()))
+        self.assertEqual(2, summary['network'].calls)
+        self.assertAlmostEqual(0.6, summary['network'].total)
+        self.assertAlmostEqual(0.3, summary['network'].mean)
+        self.assertAlmostEqual(0.4, summary['network'].max)
+
+    def test_table(self):
+        profiler = Profiler()
+        profiler.samples = [('url', 0.001), ('network', 0.003)]
+
+        lines = profiler.table().splitlines()
+
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[1].startswith('url'))
+        self.assertTrue(lines[2].rstrip().endswith('75.0'))
+
+
+class APIClientProfileTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_profile_phases(self, requests_mock):
+        response_mock = Mock()
+        response_mock.status_code = 201
+        response_mock.content = json.dumps({'id': 1})
+        requests_mock.Session.return_value.post.return_value = response_mock
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        with cli.profile() as profiler:
+            p.add({'name': 'x'})
+        p.add({'name': 'y'})
+
+        self.assertEqual(['url', 'encode', 'network', 'decode', 'wrap'],
+                         [phase for phase, _ in profiler.samples])
+        self.assertEqual(None, cli.profiler)
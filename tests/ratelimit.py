@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+import unittest
+
+from mock import Mock, patch
+
+from tiendanube.api import APIClient
+from tiendanube.ratelimit import RateLimiter
+from tiendanube.resources import ProductResource
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_fresh_bucket(self):
+        limiter = RateLimiter(limit=40)
+
+        self.assertEqual((40, 40, 0.0), limiter.bucket('46'))
+
+    def test_acquire_fills_bucket(self):
+        limiter = RateLimiter(limit=10, leak_rate=0.001)
+        for _ in range(4):
+            limiter.acquire('46')
+
+        self.assertEqual(6, limiter.bucket('46').remaining)
+        self.assertEqual(10, limiter.bucket('47').remaining)
+
+    def test_acquire_waits_for_room(self):
+        limiter = RateLimiter(limit=3, leak_rate=20, headroom=1)
+        start = time.time()
+        for _ in range(4):
+            limiter.acquire('46')
+
+        # Two requests fit right away, the other two wait for a leak each.
+        self.assertTrue(time.time() - start >= 0.09)
+
+    def test_update_from_headers(self):
+        limiter = RateLimiter(limit=40, leak_rate=0.001)
+        limiter.update('46', 200, {'x-rate-limit-limit': '80',
+                                   'x-rate-limit-remaining': '30',
+                                   'x-rate-limit-reset': '25000'})
+
+        state = limiter.bucket('46')
+        self.assertEqual(80, state.limit)
+        self.assertEqual(30, state.remaining)
+
+    def test_update_too_many_requests(self):
+        limiter = RateLimiter(limit=40, leak_rate=0.001)
+        limiter.update('46', 429, {})
+
+        self.assertEqual(0, limiter.bucket('46').remaining)
+
+
+class APIClientRateLimitTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_requests_are_tracked(self, requests_mock):
+        response_mock = Mock()
+        response_mock.status_code = 200
+        response_mock.content = json.dumps({'id': 1})
+        response_mock.headers = {'x-rate-limit-limit': '40',
+                                 'x-rate-limit-remaining': '12'}
+        requests_mock.Session.return_value.get.return_value = response_mock
+        cli = APIClient('test_api_key', 'test user agent')
+
+        ProductResource(cli, '46').get(1)
+
+        self.assertEqual(12, cli.get_rate_limit(46).remaining)
+
+    @patch('tiendanube.api.requests')
+    def test_disabled(self, requests_mock):
+        cli = APIClient('test_api_key', 'test user agent', rate_limit=False)
+
+        self.assertEqual(None, cli.rate_limiter)
+        self.assertEqual(None, cli.get_rate_limit(46))
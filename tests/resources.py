@@ -2,17 +2,23 @@
 import datetime
 import json
 import unittest
+from decimal import Decimal
 
 from bunch import bunchify
 from mock import Mock, patch
 from pytz import utc
+from requests.exceptions import ConnectionError
 
 from tiendanube.api import APIClient
+from tiendanube.resources.exceptions import APIError
+from tiendanube.resources.results import RAW, Tuples
 from tiendanube.resources import (CustomerResource, StoreResource,
                                   ScriptResource, ProductResource,
                                   OrderResource, WebhookResource,
                                   CategoryResource)
 
+from .helpers import response, stream_response
+
 
 class StoreResourceReadTest(unittest.TestCase):
 
@@ -21,7 +27,7 @@ class StoreResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 46, 'name': 'test store'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = StoreResource(cli, '46')
 
@@ -29,7 +35,7 @@ class StoreResourceReadTest(unittest.TestCase):
 
         self.assertEqual(bunchify({'id': 46, 'name': 'test store'}), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/store',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -46,7 +52,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 46, 'name': 'test prod'},
             {'id': 47, 'name': 'test prod 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -57,7 +63,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 47, 'name': 'test prod 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -71,7 +77,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -82,7 +88,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'}
@@ -95,7 +101,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -105,7 +111,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id', 'since_id': 47}
@@ -118,7 +124,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -129,7 +135,7 @@ class ProductResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'},
@@ -140,7 +146,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -149,7 +155,7 @@ class ProductResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -160,7 +166,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -169,7 +175,7 @@ class ProductResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -178,7 +184,7 @@ class ProductResourceReadTest(unittest.TestCase):
         res = res.variants.list()
         self.assertEqual(bunchify([{'id': 991, 'name': 'test prod variant'}]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991/variants',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -189,7 +195,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -198,7 +204,7 @@ class ProductResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -207,7 +213,7 @@ class ProductResourceReadTest(unittest.TestCase):
         res = res.variants.get(1)
         self.assertEqual(bunchify({'id': 1, 'name': 'test prod variant'}), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991/variants/1',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -218,7 +224,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -227,7 +233,7 @@ class ProductResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -236,7 +242,7 @@ class ProductResourceReadTest(unittest.TestCase):
         res = res.images.list()
         self.assertEqual(bunchify([{'id': 991, 'name': 'test prod image'}]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991/images',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -247,7 +253,7 @@ class ProductResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -256,7 +262,7 @@ class ProductResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -265,7 +271,7 @@ class ProductResourceReadTest(unittest.TestCase):
         res = res.images.get(1)
         self.assertEqual(bunchify({'id': 1, 'name': 'test prod image'}), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991/images/1',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -282,7 +288,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 46, 'name': 'test cust'},
             {'id': 47, 'name': 'test cust 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -293,7 +299,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 47, 'name': 'test cust 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -307,7 +313,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -318,7 +324,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'},
@@ -331,7 +337,7 @@ class CustomerResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -341,7 +347,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'fields': 'id'},
@@ -354,7 +360,7 @@ class CustomerResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -365,7 +371,7 @@ class CustomerResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'},
@@ -376,7 +382,7 @@ class CustomerResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -385,7 +391,7 @@ class CustomerResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -402,7 +408,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 46, 'name': 'test order'},
             {'id': 47, 'name': 'test order 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -413,7 +419,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 47, 'name': 'test order 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -427,7 +433,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -438,7 +444,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'}
@@ -451,7 +457,7 @@ class OrderResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -461,7 +467,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'fields': 'id'},
@@ -474,7 +480,7 @@ class OrderResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -485,7 +491,7 @@ class OrderResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'},
@@ -496,7 +502,7 @@ class OrderResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -505,7 +511,7 @@ class OrderResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -522,7 +528,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 46, 'src': 'test script'},
             {'id': 47, 'src': 'test script 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -533,7 +539,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 47, 'src': 'test script 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -547,7 +553,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -558,7 +564,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'}
@@ -571,7 +577,7 @@ class ScriptResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -581,7 +587,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'fields': 'id'}
@@ -594,7 +600,7 @@ class ScriptResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -605,7 +611,7 @@ class ScriptResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'}
@@ -616,7 +622,7 @@ class ScriptResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -625,7 +631,7 @@ class ScriptResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -642,7 +648,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 46, 'src': 'test webh'},
             {'id': 47, 'src': 'test webh 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -653,7 +659,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 47, 'src': 'test webh 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -667,7 +673,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -678,7 +684,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'}
@@ -691,7 +697,7 @@ class WebhookResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -701,7 +707,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'fields': 'id'}
@@ -714,7 +720,7 @@ class WebhookResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -725,7 +731,7 @@ class WebhookResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'}
@@ -736,7 +742,7 @@ class WebhookResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -745,7 +751,7 @@ class WebhookResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -762,7 +768,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 46, 'name': 'test cat'},
             {'id': 47, 'name': 'test cat 2'},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -773,7 +779,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 47, 'name': 'test cat 2'},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -787,7 +793,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 46},
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -798,7 +804,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'fields': 'id'},
@@ -811,7 +817,7 @@ class CategoryResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -821,7 +827,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'fields': 'id'},
@@ -834,7 +840,7 @@ class CategoryResourceReadTest(unittest.TestCase):
         response_mock.content = json.dumps([
             {'id': 47},
         ])
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -845,7 +851,7 @@ class CategoryResourceReadTest(unittest.TestCase):
             {'id': 47},
         ]), res)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params={'since_id': 47, 'created_at_min': '2013-01-01T00:00:00+00:00', 'fields': 'id'}
@@ -856,7 +862,7 @@ class CategoryResourceReadTest(unittest.TestCase):
         response_mock = Mock()
         response_mock.status_code = 200
         response_mock.content = json.dumps({'id': 991, 'name': 'test prod'})
-        requests_mock.get.return_value = response_mock
+        requests_mock.Session.return_value.get.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -865,7 +871,7 @@ class CategoryResourceReadTest(unittest.TestCase):
 
         self.assertEqual(991, res.id)
 
-        requests_mock.get.assert_called_with(
+        requests_mock.Session.return_value.get.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
             params=None
@@ -878,10 +884,10 @@ class ProductResourceWriteTest(unittest.TestCase):
     def test_add_product(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test prod'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
@@ -891,7 +897,7 @@ class ProductResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test prod'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test prod'})
@@ -901,16 +907,16 @@ class ProductResourceWriteTest(unittest.TestCase):
     def test_update_product(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test prod'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         p = ProductResource(cli, '46')
 
         p.update({'id': 991, 'name': 'test prod updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/products/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test prod updated'})
@@ -923,10 +929,10 @@ class CustomerResourceWriteTest(unittest.TestCase):
     def test_add_customer(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test cust'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
@@ -936,7 +942,7 @@ class CustomerResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test cust'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test cust'})
@@ -946,16 +952,16 @@ class CustomerResourceWriteTest(unittest.TestCase):
     def test_update_customer(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test cust'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CustomerResource(cli, '46')
 
         c.update({'id': 991, 'name': 'test cust updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/customers/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test cust updated'})
@@ -968,10 +974,10 @@ class OrderResourceWriteTest(unittest.TestCase):
     def test_add_order(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test order'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
@@ -981,7 +987,7 @@ class OrderResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test order'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test order'})
@@ -991,16 +997,16 @@ class OrderResourceWriteTest(unittest.TestCase):
     def test_update_order(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test order'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         o = OrderResource(cli, '46')
 
         o.update({'id': 991, 'name': 'test order updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/orders/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test order updated'})
@@ -1012,10 +1018,10 @@ class ScriptResourceWriteTest(unittest.TestCase):
     def test_add_script(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test script'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
@@ -1025,7 +1031,7 @@ class ScriptResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test script'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test script'})
@@ -1035,16 +1041,16 @@ class ScriptResourceWriteTest(unittest.TestCase):
     def test_update_script(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test script'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         s = ScriptResource(cli, '46')
 
         s.update({'id': 991, 'name': 'test script updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/scripts/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test script updated'})
@@ -1056,10 +1062,10 @@ class WebhookResourceWriteTest(unittest.TestCase):
     def test_add_webhook(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test webhook'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
@@ -1069,7 +1075,7 @@ class WebhookResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test webhook'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test webhook'})
@@ -1079,16 +1085,16 @@ class WebhookResourceWriteTest(unittest.TestCase):
     def test_update_webhook(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test web'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         w = WebhookResource(cli, '46')
 
         w.update({'id': 991, 'name': 'test web updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/webhooks/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test web updated'})
@@ -1100,10 +1106,10 @@ class CategoryResourceWriteTest(unittest.TestCase):
     def test_add_category(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 201
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 46, 'name': 'test category'},
         )
-        requests_mock.post.return_value = response_mock
+        requests_mock.Session.return_value.post.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
@@ -1113,7 +1119,7 @@ class CategoryResourceWriteTest(unittest.TestCase):
             {'id': 46, 'name': 'test category'}
         ), res)
 
-        requests_mock.post.assert_called_with(
+        requests_mock.Session.return_value.post.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 46, 'name': 'test category'})
@@ -1123,17 +1129,356 @@ class CategoryResourceWriteTest(unittest.TestCase):
     def test_update_category(self, requests_mock):
         response_mock = Mock()
         response_mock.status_code = 200
-        response_mock.text = json.dumps(
+        response_mock.content = json.dumps(
             {'id': 991, 'name': 'test cat'},
         )
-        requests_mock.put.return_value = response_mock
+        requests_mock.Session.return_value.put.return_value = response_mock
         cli = APIClient('test_api_key', 'test user agent')
         c = CategoryResource(cli, '46')
 
         c.update({'id': 991, 'name': 'test cat updated'})
 
-        requests_mock.put.assert_called_with(
+        requests_mock.Session.return_value.put.assert_called_with(
             url='https://api.tiendanube.com/v1/46/categories/991',
             headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent', 'Content-Type': 'application/json; charset=utf-8'},
             data=json.dumps({'id': 991, 'name': 'test cat updated'})
         )
+
+
+class ListResourceIterAllTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_iter_all_pages(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response([{'id': 1}, {'id': 2}]),
+            response([{'id': 3}, {'id': 4}]),
+            response([{'id': 5}]),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = p.iter_all(filters={'since_id': 0}, fields='id', per_page=2)
+
+        self.assertEqual([1, 2, 3, 4, 5], [r.id for r in res])
+        calls = requests_mock.Session.return_value.get.call_args_list
+        self.assertEqual(
+            [{'since_id': 0, 'fields': 'id', 'page': page, 'per_page': 2} for page in (1, 2, 3)],
+            [c[1]['params'] for c in calls]
+        )
+
+    @patch('tiendanube.api.requests')
+    def test_iter_all_is_lazy(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response([{'id': 1}, {'id': 2}]),
+            response([{'id': 3}]),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = p.iter_all(per_page=2)
+
+        self.assertEqual(0, requests_mock.Session.return_value.get.call_count)
+        self.assertEqual(1, next(res).id)
+
+    def test_iter_all_per_page_over_max(self):
+        p = ProductResource(APIClient('test_api_key', 'test user agent'), '46')
+
+        self.assertRaises(ValueError, p.iter_all, per_page=250)
+        self.assertRaises(ValueError, p.iter_all, per_page=250, stream=True)
+        self.assertRaises(ValueError, p.iter_all, per_page=0)
+
+    @patch('tiendanube.api.requests')
+    def test_iter_all_past_last_page(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response([{'id': 1}, {'id': 2}]),
+            response({'code': 404}, status_code=404),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        o = OrderResource(cli, '46')
+
+        self.assertEqual([1, 2], [r.id for r in o.iter_all(per_page=2)])
+
+    @patch('tiendanube.api.requests')
+    def test_iter_all_subresource(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response({'id': 991}),
+            response([{'id': 1}]),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = list(p.get(991).images.iter_all(per_page=10))
+
+        self.assertEqual([1], [r.id for r in res])
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products/991/images',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params={'page': 1, 'per_page': 10}
+        )
+
+
+class ListResourceStreamTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_stream(self, requests_mock):
+        response = stream_response([{'id': 1}, {'id': 2}])
+        requests_mock.Session.return_value.get.return_value = response
+        cli = APIClient('test_api_key', 'test user agent')
+        o = OrderResource(cli, '46')
+
+        self.assertEqual([1, 2], [r.id for r in o.stream({'status': 'open'})])
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/orders',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params={'status': 'open'},
+            stream=True
+        )
+        self.assertTrue(response.close.called)
+
+    @patch('tiendanube.api.requests')
+    def test_iter_all_streamed(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            stream_response([{'id': 1}, {'id': 2}]),
+            stream_response([{'id': 3}, {'id': 4}]),
+            response({'code': 404}, status_code=404),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = p.iter_all(per_page=2, stream=True)
+
+        self.assertEqual([1, 2, 3, 4], [r.id for r in res])
+        self.assertEqual(3, requests_mock.Session.return_value.get.call_count)
+
+
+class ListResourceGetManyTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_get_many(self, requests_mock):
+        def get(url, headers, params):
+            id = int(url.rsplit('/', 1)[1])
+            if id == 3:
+                return response({'code': 404}, status_code=404)
+            return response({'id': id})
+        requests_mock.Session.return_value.get.side_effect = get
+        cli = APIClient('test_api_key', 'test user agent')
+        o = OrderResource(cli, '46')
+
+        res = o.get_many(range(1, 21), max_workers=4)
+
+        self.assertEqual(20, len(res))
+        self.assertTrue(isinstance(res[2], APIError))
+        self.assertEqual(404, res[2].code)
+        self.assertEqual([i for i in range(1, 21) if i != 3],
+                         [r.id for r in res if not isinstance(r, APIError)])
+
+    @patch('tiendanube.api.requests')
+    def test_get_many_connection_error(self, requests_mock):
+        def get(url, headers, params):
+            if url.endswith('/2'):
+                raise ConnectionError('reset')
+            return response({'id': int(url.rsplit('/', 1)[1])})
+        requests_mock.Session.return_value.get.side_effect = get
+        cli = APIClient('test_api_key', 'test user agent')
+
+        res = OrderResource(cli, '46').get_many([1, 2, 3])
+
+        self.assertEqual(1, res[0].id)
+        self.assertTrue(isinstance(res[1], ConnectionError))
+        self.assertEqual(3, res[2].id)
+
+    @patch('tiendanube.api.requests')
+    def test_get_many_subresource(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response({'id': 991}),
+            response({'id': 5}),
+        ]
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = p.get(991).variants.get_many([5])
+
+        self.assertEqual([5], [r.id for r in res])
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products/991/variants/5',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params=None
+        )
+
+
+class ListResourceBulkTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_add_many(self, requests_mock):
+        def post(url, headers, data):
+            record = json.loads(data)
+            if record['handle'] == 'bad':
+                return response({'code': 422}, status_code=422)
+            return response(dict(record, id=len(record['handle'])))
+        requests_mock.Session.return_value.post.side_effect = post
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+        records = [{'handle': 'a'}, {'handle': 'bad'}, {'handle': 'ccc'}, {'handle': 'a'}]
+
+        report = p.add_many(records, max_workers=2, key=lambda r: r['handle'])
+
+        self.assertFalse(report.ok)
+        self.assertEqual([(0, 1), (2, 3)], [(i.index, i.result.id) for i in report.succeeded])
+        self.assertEqual([1, 3], [i.index for i in report.failed])
+        self.assertEqual(422, report.failed[0].error.code)
+        self.assertTrue(isinstance(report.failed[1].error, ValueError))
+        self.assertEqual(3, requests_mock.Session.return_value.post.call_count)
+
+        report = p.add_many(records, key=lambda r: r['handle'], skip=report.done_keys())
+
+        self.assertEqual(['bad'], [i.key for i in report.items])
+
+    @patch('tiendanube.api.requests')
+    def test_update_many(self, requests_mock):
+        requests_mock.Session.return_value.put.side_effect = \
+            lambda url, headers, data: response(json.loads(data))
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        report = p.update_many([{'id': i, 'price': '1.0'} for i in range(10)], max_workers=4)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(list(range(10)), [i.key for i in report.succeeded])
+        self.assertEqual(10, requests_mock.Session.return_value.put.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_update_many_connection_error(self, requests_mock):
+        def put(url, headers, data):
+            if url.endswith('/3'):
+                raise ConnectionError('reset')
+            return response(json.loads(data))
+        requests_mock.Session.return_value.put.side_effect = put
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        report = p.update_many([{'id': i} for i in range(10)], max_workers=4)
+
+        self.assertEqual([3], [i.key for i in report.failed])
+        self.assertTrue(isinstance(report.failed[0].error, ConnectionError))
+        self.assertEqual(set(range(10)) - set([3]), report.done_keys())
+
+
+    @patch('tiendanube.api.requests')
+    def test_update_many_unencodable_record(self, requests_mock):
+        put = requests_mock.Session.return_value.put
+        put.side_effect = lambda url, headers, data: response(json.loads(data))
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+        records = [{'id': i} for i in range(5)] + [{'id': 5, 'price': Decimal('2.5')}]
+
+        report = p.update_many(records, max_workers=4)
+
+        self.assertEqual([5], [i.key for i in report.failed])
+        self.assertTrue(isinstance(report.failed[0].error, TypeError))
+        self.assertEqual(set(range(5)), report.done_keys())
+        self.assertEqual(5, put.call_count)
+
+
+class ProductResourceIncludeTest(unittest.TestCase):
+
+    def _get(self, url, headers, params):
+        path = url.split('/v1/46/')[1]
+        if path == 'products/1':
+            return response({'id': 1, 'images': [{'id': 7}]})
+        if path == 'products':
+            return response([{'id': 1}, {'id': 2, 'variants': [{'id': 20}]}])
+        if path.endswith('/variants'):
+            id = int(path.split('/')[1])
+            return response([{'id': id * 10}, {'id': id * 10 + 1}])
+        return response({'code': 404}, status_code=404)
+
+    @patch('tiendanube.api.requests')
+    def test_get_include(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = self._get
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        product = p.get(1, include=['variants', 'images'])
+
+        self.assertEqual([10, 11], [v.id for v in product.variants])
+        self.assertEqual([7], [i.id for i in product.images])
+        # Images were embedded, only variants needed a request.
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_list_include(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = self._get
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        products = p.list(include=['variants'], mode=RAW)
+
+        self.assertEqual([[10, 11], [20]], [[v['id'] for v in r['variants']] for r in products])
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
+
+    def test_include_checks(self):
+        p = ProductResource(APIClient('test_api_key', 'test user agent'), '46')
+
+        self.assertRaises(ValueError, p.get, 1, include=['reviews'])
+        self.assertRaises(ValueError, p.list, include=['images'], mode=Tuples(['id']))
+
+
+class ProductResourceCrawlTest(unittest.TestCase):
+
+    def _get(self, url, headers, params):
+        path = url.split('/v1/46/')[1]
+        if path == 'products':
+            return response([{'id': 1}, {'id': 2}, {'id': 3}])
+        id = int(path.split('/')[1])
+        if id == 2:
+            return response({'code': 404}, status_code=404)
+        page = params['page']
+        if page == 1:
+            return response([{'id': id * 10}, {'id': id * 10 + 1}])
+        if page == 2 and id == 3:
+            return response([{'id': 32}])
+        return response([])
+
+    @patch('tiendanube.api.requests')
+    def test_crawl(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = self._get
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        pairs = list(p.crawl_subresource('images', product_ids=[1, 2, 3], concurrency=2,
+                                         per_page=2))
+
+        items = sorted((id, item.id) for id, item in pairs if not isinstance(item, APIError))
+        self.assertEqual([(1, 10), (1, 11), (3, 30), (3, 31), (3, 32)], items)
+        errors = [(id, item.code) for id, item in pairs if isinstance(item, APIError)]
+        self.assertEqual([(2, 404)], errors)
+
+    @patch('tiendanube.api.requests')
+    def test_crawl_connection_error(self, requests_mock):
+        def get(url, headers, params):
+            if url.endswith('/products/2/images'):
+                raise ConnectionError('reset')
+            return self._get(url, headers, params)
+        requests_mock.Session.return_value.get.side_effect = get
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        pairs = list(p.crawl_subresource('images', product_ids=[1, 2, 3, 4], concurrency=2,
+                                         per_page=2))
+
+        self.assertEqual([2], [id for id, item in pairs if isinstance(item, ConnectionError)])
+        self.assertEqual(set([1, 3, 4]),
+                         set(id for id, item in pairs if not isinstance(item, Exception)))
+
+    @patch('tiendanube.api.requests')
+    def test_crawl_every_product(self, requests_mock):
+        requests_mock.Session.return_value.get.side_effect = self._get
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        pairs = list(p.crawl_subresource('variants', mode=RAW))
+
+        self.assertEqual(set([1, 3]), set(id for id, item in pairs if isinstance(item, dict)))
+        first = requests_mock.Session.return_value.get.call_args_list[0]
+        self.assertEqual('id', first[1]['params']['fields'])
+        self.assertRaises(ValueError, list, p.crawl_subresource('reviews'))
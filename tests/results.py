@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import copy
+import json
+import pickle
+import unittest
+
+from bunch import bunchify
+
+from mock import patch
+
+from tiendanube.api import APIClient
+from tiendanube.resources import ProductResource
+from tiendanube.resources.results import (RAW, Columns, Lazy, Result, ResultList, attach,
+                                          Tuples, convert, to_result)
+
+
+PRODUCT = {
+    'id': 1,
+    'name': {'es': 'Remera', 'pt': 'Camiseta'},
+    'variants': [{'id': 10, 'price': '9.99'}, {'id': 11, 'price': '10.99'}],
+}
+
+
+class ResultTest(unittest.TestCase):
+
+    def test_attribute_access(self):
+        p = to_result(PRODUCT)
+
+        self.assertEqual('Remera', p.name.es)
+        self.assertEqual('Camiseta', p['name']['pt'])
+        self.assertEqual(['9.99', '10.99'], [v.price for v in p.variants])
+        self.assertEqual(11, p.variants[1].id)
+        self.assertRaises(AttributeError, getattr, p, 'missing')
+
+    def test_nested_values_wrapped_lazily(self):
+        p = to_result(PRODUCT)
+
+        self.assertTrue(p.toDict() is PRODUCT)
+        self.assertTrue(isinstance(p.name, Result))
+        self.assertTrue(isinstance(p.variants, ResultList))
+
+    def test_equality(self):
+        p = to_result(PRODUCT)
+
+        self.assertEqual(PRODUCT, p)
+        self.assertEqual(bunchify(PRODUCT), p)
+        self.assertEqual(p, to_result(dict(PRODUCT)))
+        self.assertNotEqual(p, to_result({'id': 2}))
+        self.assertEqual(bunchify([PRODUCT]), to_result([PRODUCT]))
+
+    def test_top_level_list(self):
+        res = to_result([PRODUCT, {'id': 2}])
+
+        self.assertTrue(isinstance(res, list))
+        self.assertEqual([1, 2], [r.id for r in res])
+
+    def test_attached_attributes(self):
+        p = to_result(PRODUCT)
+        attach(p, 'variants', 'handle')
+
+        self.assertEqual('handle', p.variants)
+        self.assertEqual(PRODUCT, p)
+        self.assertEqual(2, len(PRODUCT['variants']))
+        self.assertEqual(set(), p.changed_fields())
+
+    def test_lazy_attached_attributes(self):
+        built = []
+        p = to_result(PRODUCT)
+        attach(p, 'variants', Lazy(lambda *args: built.append(args) or 'handle', 1, 'variants'))
+
+        self.assertEqual([], built)
+        self.assertEqual('handle', p.variants)
+        self.assertEqual('handle', p.variants)
+        self.assertEqual([(1, 'variants')], built)
+
+    def test_change_tracking(self):
+        p = to_result(json.loads(json.dumps(PRODUCT, sort_keys=True)))
+        self.assertEqual({'id': 1}, p.changes())
+
+        p['name']['es'] = 'Camisa'
+        p.variants[0]['price'] = '8.99'
+        p.handle = 'camisa'
+
+        self.assertEqual(set(['name', 'variants', 'handle']), p.changed_fields())
+        self.assertEqual('Camisa', p.changes()['name']['es'])
+        self.assertEqual('8.99', p.changes()['variants'][0]['price'])
+        p.clear_changes()
+        self.assertEqual({'id': 1}, p.changes())
+
+    @patch('tiendanube.api.requests')
+    def test_update_sends_changes(self, requests_mock):
+        get = requests_mock.Session.return_value.get.return_value
+        get.status_code = 200
+        get.content = json.dumps(PRODUCT)
+        put = requests_mock.Session.return_value.put.return_value
+        put.status_code = 200
+        put.content = json.dumps(dict(PRODUCT, price='20.0'))
+        products = ProductResource(APIClient('test_api_key', 'test user agent'), '46')
+        p = products.get(1)
+
+        p.price = '20.0'
+        products.update(p)
+
+        self.assertEqual('20.0', p.price)
+        self.assertEqual({'id': 1, 'price': '20.0'},
+                         json.loads(requests_mock.Session.return_value.put.call_args[1]['data']))
+        self.assertEqual(set(), p.changed_fields())
+
+
+class ResultModeTest(unittest.TestCase):
+
+    def test_copy(self):
+        p = to_result({'id': 1, 'name': {'es': 'Remera'}, 'variants': []})
+        p.price = '10.0'
+        attach(p, 'images', 'handle')
+
+        c = copy.copy(p)
+        c.id = 2
+
+        self.assertEqual(1, p.id)
+        self.assertTrue(c.name.toDict() is p.name.toDict())
+        self.assertEqual(set(['id', 'price']), c.changed_fields())
+        self.assertRaises(AttributeError, getattr, c, 'images')
+        self.assertEqual([], copy.copy(p.variants))
+
+    def test_deepcopy(self):
+        p = to_result(PRODUCT)
+
+        c = copy.deepcopy(p)
+        c.name.es = 'Camisa'
+
+        self.assertEqual('Camisa', c.name.es)
+        self.assertEqual('Remera', p.name.es)
+        self.assertEqual(set(['name']), c.changed_fields())
+        self.assertEqual(set(), p.changed_fields())
+        self.assertEqual(p.variants, copy.deepcopy(p.variants))
+
+    def test_pickle(self):
+        p = to_result(PRODUCT)
+        p.price = '10.0'
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            c = pickle.loads(pickle.dumps(p, protocol))
+
+            self.assertEqual(p, c)
+            self.assertEqual(set(['price']), c.changed_fields())
+            self.assertEqual(p.variants, pickle.loads(pickle.dumps(p.variants, protocol)))
+
+    def test_raw(self):
+        self.assertTrue(convert(PRODUCT, RAW) is PRODUCT)
+
+    def test_named_tuples(self):
+        res = convert([PRODUCT, {'id': 2}], Tuples(['id', 'name']))
+
+        self.assertEqual(1, res[0].id)
+        self.assertEqual((2, None), res[1])
+
+    def test_plain_tuples(self):
+        res = convert(PRODUCT, Tuples(['id'], named=False))
+
+        self.assertEqual((1,), res)
+        self.assertEqual(tuple, type(res))
+
+    def test_columns(self):
+        res = convert([PRODUCT, {'id': 2}], Columns(['id', 'variants']))
+
+        self.assertEqual([1, 2], res['id'])
+        self.assertEqual([PRODUCT['variants'], None], res['variants'])
+
+    @patch('tiendanube.api.requests')
+    def test_list_projection_requests_fields(self, requests_mock):
+        response_mock = requests_mock.Session.return_value.get.return_value
+        response_mock.status_code = 200
+        response_mock.content = json.dumps([{'id': 1, 'stock': 3}])
+        cli = APIClient('test_api_key', 'test user agent')
+        p = ProductResource(cli, '46')
+
+        res = p.list(mode=Tuples(['id', 'stock']))
+
+        self.assertEqual([(1, 3)], res)
+        requests_mock.Session.return_value.get.assert_called_with(
+            url='https://api.tiendanube.com/v1/46/products',
+            headers={'Authentication': 'bearer test_api_key', 'User-Agent': 'test user agent'},
+            params={'fields': 'id,stock'}
+        )
+
+    @patch('tiendanube.api.requests')
+    def test_get_raw_has_no_subresources(self, requests_mock):
+        response_mock = requests_mock.Session.return_value.get.return_value
+        response_mock.status_code = 200
+        response_mock.content = json.dumps({'id': 1})
+        cli = APIClient('test_api_key', 'test user agent')
+
+        self.assertEqual({'id': 1}, ProductResource(cli, '46').get(1, mode=RAW))
+
+    def test_iter_all_columns(self):
+        p = ProductResource(APIClient('test_api_key', 'test user agent'), '46')
+
+        self.assertRaises(ValueError, p.iter_all, mode=Columns(['id']))
+        self.assertRaises(ValueError, p.iter_all, mode=Columns(['id']), stream=True)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from mock import patch
+from requests.exceptions import ConnectionError
+
+from tiendanube.api import APIClient
+from tiendanube.resources import ProductResource
+from tiendanube.resources.exceptions import APIError
+from tiendanube.retry import RetryPolicy
+
+from .helpers import response
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+        for attempt in range(1, 10):
+            delay = policy.backoff(attempt)
+            self.assertTrue(0 <= delay <= min(5, 2 ** attempt))
+
+    def test_retry_after(self):
+        policy = RetryPolicy()
+
+        self.assertEqual(7.0, policy.backoff(
+            1, response(status_code=429, headers={'Retry-After': '7'})))
+
+    def test_only_idempotent_verbs(self):
+        policy = RetryPolicy()
+
+        self.assertEqual(None, policy.get_delay('post', 1, response=response(status_code=503)))
+        self.assertNotEqual(None, policy.get_delay('get', 1, response=response(status_code=503)))
+
+    def test_not_retried_status(self):
+        policy = RetryPolicy()
+
+        self.assertEqual(None, policy.get_delay('get', 1, response=response(status_code=404)))
+
+    def test_max_attempts(self):
+        policy = RetryPolicy(max_attempts=2)
+
+        self.assertEqual(None, policy.get_delay('get', 2, error=ConnectionError()))
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=2, budget_window=60)
+        delays = [policy.get_delay('get', 1, response=response(status_code=500)) for _ in range(3)]
+
+        self.assertEqual(None, delays[2])
+        self.assertTrue(all(d is not None for d in delays[:2]))
+
+
+@patch('tiendanube.api.time')
+class APIClientRetryTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_retries_until_success(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            response(status_code=503),
+            response(status_code=429, headers={'Retry-After': '2'}),
+            response({'id': 1}),
+        ]
+        events = []
+        policy = RetryPolicy(max_attempts=3, listeners=[events.append])
+        cli = APIClient('test_api_key', 'test user agent', retry_policy=policy,
+                        rate_limit=False)
+
+        res = ProductResource(cli, '46').get(1)
+
+        self.assertEqual(1, res.id)
+        self.assertEqual([503, 429], [e.status_code for e in events])
+        self.assertEqual([1, 2], [e.attempt for e in events])
+        self.assertEqual(2.0, events[1].delay)
+        self.assertEqual(2, time_mock.sleep.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_connection_errors(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.get.side_effect = [
+            ConnectionError('reset'),
+            response({'id': 1}),
+        ]
+        cli = APIClient('test_api_key', 'test user agent', retry_policy=RetryPolicy())
+
+        self.assertEqual(1, ProductResource(cli, '46').get(1).id)
+
+    @patch('tiendanube.api.requests')
+    def test_gives_up(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.get.return_value = response(status_code=500)
+        cli = APIClient('test_api_key', 'test user agent',
+                        retry_policy=RetryPolicy(max_attempts=4))
+
+        self.assertRaises(APIError, ProductResource(cli, '46').get, 1)
+        self.assertEqual(4, requests_mock.Session.return_value.get.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_post_not_retried(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.post.return_value = response(status_code=503)
+        cli = APIClient('test_api_key', 'test user agent', retry_policy=RetryPolicy())
+
+        self.assertRaises(APIError, ProductResource(cli, '46').add, {'name': 'x'})
+        self.assertEqual(1, requests_mock.Session.return_value.post.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_refused_post_retried(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.post.side_effect = [
+            response(status_code=429), response({'id': 1}, 201)]
+        cli = APIClient('test_api_key', 'test user agent', rate_limit=False,
+                        retry_policy=RetryPolicy())
+
+        self.assertEqual(1, ProductResource(cli, '46').add({'name': 'x'}).id)
+        self.assertEqual(2, requests_mock.Session.return_value.post.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_no_policy(self, requests_mock, time_mock):
+        requests_mock.Session.return_value.get.side_effect = ConnectionError('reset')
+        cli = APIClient('test_api_key', 'test user agent')
+
+        self.assertRaises(ConnectionError, ProductResource(cli, '46').get, 1)
@@ -1,6 +1,19 @@
 # -*- coding: utf-8 -*-
+from api import *
+from cache import *
+from client import *
+from codec import *
+from concurrency import *
+from hooks import *
+from mirror import *
+from profiling import *
+from ratelimit import *
 from resources import *
+from results import *
+from retry import *
+from singleflight import *
+from sync import *
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
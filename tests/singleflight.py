@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+
+from mock import patch
+
+from tiendanube.api import APIClient
+from tiendanube.client import AsyncNubeClient
+from tiendanube.concurrency import run_in_thread
+from tiendanube.resources import ProductResource
+from tiendanube.singleflight import SingleFlight
+
+from .helpers import response
+
+
+def _wait_for(condition):
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def test_shares_result(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def call():
+            release.wait()
+            return object()
+
+        futures = [run_in_thread(flight.do, 'key', call) for _ in range(5)]
+        _wait_for(lambda: flight.saved == 4)
+        release.set()
+
+        results = [f.result() for f in futures]
+        self.assertEqual(1, len(set(id(r) for r in results)))
+        self.assertEqual((1, 4), (flight.calls, flight.saved))
+        self.assertFalse(flight.do('key', object) is results[0])
+
+    def test_shares_error(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def call():
+            release.wait()
+            raise ValueError('boom')
+
+        futures = [run_in_thread(flight.do, 'key', call) for _ in range(3)]
+        _wait_for(lambda: flight.saved == 2)
+        release.set()
+
+        self.assertTrue(all(isinstance(f.exception(), ValueError) for f in futures))
+        self.assertEqual(1, flight.calls)
+
+    def test_different_keys(self):
+        flight = SingleFlight()
+
+        self.assertEqual([1, 2], [flight.do(k, lambda k=k: k) for k in (1, 2)])
+        self.assertEqual((2, 0), (flight.calls, flight.saved))
+
+
+class APIClientSingleFlightTest(unittest.TestCase):
+
+    @patch('tiendanube.api.requests')
+    def test_coalesces_gets(self, requests_mock):
+        release = threading.Event()
+
+        def get(url, headers, params):
+            release.wait()
+            return response({'id': int(url.rsplit('/', 1)[1])})
+        requests_mock.Session.return_value.get.side_effect = get
+        cli = APIClient('test_api_key', 'test user agent', single_flight=True)
+        products = ProductResource(cli, '46')
+
+        futures = [run_in_thread(products.get, 1) for _ in range(4)]
+        futures.append(run_in_thread(products.get, 2))
+        _wait_for(lambda: cli.single_flight.saved == 3 and cli.single_flight.calls == 2)
+        release.set()
+
+        self.assertEqual([1, 1, 1, 1, 2], [f.result().id for f in futures])
+        self.assertEqual(2, requests_mock.Session.return_value.get.call_count)
+
+    @patch('tiendanube.api.requests')
+    def test_async_client(self, requests_mock):
+        release = threading.Event()
+
+        def get(url, headers, params):
+            release.wait()
+            return response({'id': 1, 'name': 'x'})
+        requests_mock.Session.return_value.get.side_effect = get
+        client = AsyncNubeClient('test_api_key', max_workers=10, single_flight=True)
+        store = client.get_store('46')
+
+        futures = [store.products.get(1) for _ in range(5)]
+        _wait_for(lambda: client.get_requests_saved() == 4)
+        release.set()
+
+        self.assertEqual([1] * 5, [f.result().id for f in futures])
+        self.assertEqual(1, requests_mock.Session.return_value.get.call_count)
+        client.close()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch
+
+from tiendanube.api import APIClient
+from tiendanube.resources import OrderResource
+from tiendanube.sync import (Checkpoint, FileCheckpoints, SQLiteCheckpoints,
+                             SyncEngine, parse_datetime)
+
+from .helpers import response
+
+
+class ParseDatetimeTest(unittest.TestCase):
+
+    def test_offsets(self):
+        expected = datetime.datetime(2013, 3, 11, 12, 14, 11)
+
+        self.assertEqual(expected, parse_datetime('2013-03-11T09:14:11-03:00'))
+        self.assertEqual(expected, parse_datetime('2013-03-11T12:14:11+0000'))
+        self.assertEqual(expected, parse_datetime('2013-03-11T12:14:11Z'))
+        self.assertEqual(expected, parse_datetime('2013-03-11T12:14:11'))
+        self.assertRaises(ValueError, parse_datetime, 'yesterday')
+
+
+class CheckpointsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _roundtrip(self, factory):
+        checkpoints = factory()
+        self.assertEqual(None, checkpoints.get('46', 'orders'))
+        checkpoints.set('46', 'orders', Checkpoint('2013-03-11T12:14:11+00:00', [[1, 'x']]))
+
+        self.assertEqual(Checkpoint('2013-03-11T12:14:11+00:00', [[1, 'x']]),
+                         factory().get('46', 'orders'))
+
+    def test_file(self):
+        path = os.path.join(self.tmp, 'checkpoints.json')
+        self._roundtrip(lambda: FileCheckpoints(path))
+
+    def test_sqlite(self):
+        path = os.path.join(self.tmp, 'checkpoints.db')
+        self._roundtrip(lambda: SQLiteCheckpoints(path))
+
+
+class SyncEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.checkpoints = FileCheckpoints(os.path.join(self.tmp, 'checkpoints.json'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    @patch('tiendanube.api.requests')
+    def test_incremental_sync(self, requests_mock):
+        get = requests_mock.Session.return_value.get
+        get.side_effect = [
+            response([{'id': 1, 'updated_at': '2013-03-11T09:00:00-03:00'},
+                   {'id': 2, 'updated_at': '2013-03-11T09:10:00-03:00'}]),
+            response([{'id': 2, 'updated_at': '2013-03-11T09:10:00-03:00'},
+                   {'id': 3, 'updated_at': '2013-03-11T09:08:00-03:00'},
+                   {'id': 1, 'updated_at': '2013-03-11T09:30:00-03:00'}]),
+        ]
+        orders = OrderResource(APIClient('test_api_key', 'test user agent'), '46')
+        engine = SyncEngine(self.checkpoints, overlap=300, per_page=50)
+
+        first = [r.id for r in engine.changes(orders)]
+        second = [r.id for r in engine.changes(orders)]
+
+        self.assertEqual([1, 2], first)
+        # Order 3 showed up late inside the overlap window, order 2 was
+        # already handed out and order 1 changed again.
+        self.assertEqual([3, 1], second)
+        self.assertEqual({'page': 1, 'per_page': 50}, get.call_args_list[0][1]['params'])
+        self.assertEqual('2013-03-11T12:05:00+00:00',
+                         get.call_args_list[1][1]['params']['updated_at_min'])
+        self.assertEqual('2013-03-11T12:30:00+00:00',
+                         self.checkpoints.get('46', 'orders').updated_at)
+
+    @patch('tiendanube.api.requests')
+    def test_unfinished_sync_keeps_checkpoint(self, requests_mock):
+        requests_mock.Session.return_value.get.return_value = response(
+            [{'id': 1, 'updated_at': '2013-03-11T09:00:00-03:00'}])
+        orders = OrderResource(APIClient('test_api_key', 'test user agent'), '46')
+        engine = SyncEngine(self.checkpoints)
+
+        def handler(record):
+            raise RuntimeError('boom')
+
+        self.assertRaises(RuntimeError, engine.sync, orders, handler)
+        self.assertEqual(None, self.checkpoints.get('46', 'orders'))
+        self.assertEqual(1, engine.sync(orders, lambda record: None))
@@ -1,59 +1,344 @@
 # -*- coding: utf-8 -*-
 import json
-import logging
+import time
+import zlib
+from contextlib import contextmanager
+from timeit import default_timer
+
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from furl import furl
 
-
-logging.basicConfig(format='%(levelname)s:%(message)s', level=logging.DEBUG)
+from .codec import JSONCodec
+from .concurrency import run_in_thread
+from .hooks import RequestFinished, RequestStarted, response_size, response_wire_size
+from .profiling import Profiler
+from .ratelimit import RateLimiter
+from .retry import RetryEvent
+from .singleflight import SingleFlight
 
 
-def _do_verb(verb, url, payload, headers):
+def _do_verb(session, verb, url, payload, headers, stream=False):
     params = {
         'url': url,
         'headers': headers
     }
-    method = getattr(requests, verb)
+    if stream:
+        params['stream'] = True
+    method = getattr(session, verb)
 
     if verb in ['post', 'put']:
         params['headers']['Content-Type'] = 'application/json; charset=utf-8'
-        params['data'] = json.dumps(payload)
+        params['data'] = payload
     elif verb == 'get':
         params['params'] = payload
 
     return method(**params)
 
 
+def _gzip(data):
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
 class APIClient(object):
     API_VERSION = 'v1'
     API_ENDPOINT = 'https://api.tiendanube.com'
     ARGS = ['resource_id', 'subresource', 'subresource_id']
 
-    def __init__(self, api_key, user_agent):
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    MAX_ROUTES = 10000
+
+    def __init__(self, api_key, user_agent, pool_connections=POOL_CONNECTIONS,
+                 pool_maxsize=POOL_MAXSIZE, pool_block=False, keep_alive=True,
+                 rate_limit=True, retry_policy=None, cache=None, codec=None,
+                 compress_responses=True, compress_threshold=None, single_flight=False,
+                 api_endpoint=None):
+        """
+        All the requests made through this client share a single
+        ``requests.Session``, so connections to the API are pooled and
+        reused across every Store and Resource built on top of it.
+
+        ``pool_connections`` is the number of hosts to keep pools for,
+        ``pool_maxsize`` the max connections kept open per host and
+        ``pool_block`` whether to wait for a free connection instead of
+        opening a throwaway one when the pool is exhausted.
+
+        Unless ``rate_limit`` is False, requests are paced per store by a
+        RateLimiter to stay under the API rate limit.
+
+        Failed requests are retried as told by ``retry_policy``, a
+        RetryPolicy. They are not retried by default.
+
+        GET responses are cached in ``cache``, a ResponseCache, if given.
+        Adding or updating a resource drops its cached entries.
+
+        Payloads are encoded and responses decoded with ``codec``, a
+        JSONCodec by default.
+
+        Unless ``compress_responses`` is False the API is asked for gzip or
+        deflate responses, which are decompressed as they are read. POST
+        and PUT bodies of ``compress_threshold`` bytes or more are sent
+        gzipped; they are never compressed by default.
+
+        With ``single_flight`` identical GETs (same store, URL and params)
+        made while one of them is in flight share its response or error
+        instead of each sending a request; ``single_flight`` is then the
+        SingleFlight counting the requests saved.
+
+        Callables added with ``add_listener`` get a RequestStarted and a
+        RequestFinished event for every request sent, and the RetryEvents.
+
+        ``api_endpoint`` points the client to another server than
+        API_ENDPOINT, e.g. a local stub.
+        """
         headers = {
             'Authentication': 'bearer {}'.format(api_key),
             'User-Agent': user_agent
         }
+        if not keep_alive:
+            headers['Connection'] = 'close'
         self.headers = headers
+        if api_endpoint:
+            self.API_ENDPOINT = api_endpoint
+        self.session = self._build_session(pool_connections, pool_maxsize, pool_block,
+                                           compress_responses)
+        self.rate_limiter = RateLimiter() if rate_limit else None
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.codec = codec or JSONCodec()
+        self.compress_threshold = compress_threshold
+        self.single_flight = SingleFlight() if single_flight else None
+        self._routes = {}
+        self.listeners = []
+        self.profiler = None
+
+    def _build_session(self, pool_connections, pool_maxsize, pool_block, compress_responses):
+        session = requests.Session()
+        session.headers.update({
+            'Accept-Encoding': 'gzip, deflate' if compress_responses else 'identity'
+        })
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        self.session.close()
+
+    def add_listener(self, fn):
+        self.listeners.append(fn)
+
+    def remove_listener(self, fn):
+        self.listeners.remove(fn)
+
+    def _notify(self, event):
+        for listener in self.listeners:
+            listener(event)
+
+    @contextmanager
+    def profile(self, profiler=None):
+        """
+        Time every phase of the requests made inside the ``with`` block::
+
+            with client.profile() as profiler:
+                store.products.list()
+            print(profiler.table())
+        """
+        profiler = profiler or Profiler()
+        previous, self.profiler = self.profiler, profiler
+        try:
+            yield profiler
+        finally:
+            self.profiler = previous
+
+    def get_rate_limit(self, store_id):
+        """
+        The rate limit BucketState of a store, or None if not rate limiting.
+        """
+        if self.rate_limiter:
+            return self.rate_limiter.bucket(str(store_id))
 
     def get_options(self, args):
         return [args[k] for k in self.ARGS if k in args and args[k]]
 
+    def get_route(self, id, resource):
+        """
+        The URL of a resource of a store. Routes are built once and kept,
+        up to MAX_ROUTES of them.
+        """
+        key = (self.API_ENDPOINT, id, resource)
+        route = self._routes.get(key)
+        if route is None:
+            url = furl(self.API_ENDPOINT)
+            url.path.segments = [
+                self.API_VERSION,
+                id
+            ]
+            if resource:
+                url.path.segments.append(resource)
+            route = str(url)
+            if len(self._routes) >= self.MAX_ROUTES:
+                self._routes.clear()
+            self._routes[key] = route
+        return route
+
     def make_request(self, id, resource, **kwargs):
+        profiler = self.profiler
+        if profiler:
+            start = default_timer()
+
         verb = kwargs.get('verb', 'GET').lower()
 
-        url = furl(self.API_ENDPOINT)
-        url.path.segments = [
-            self.API_VERSION,
-            id
-        ]
+        url = self.get_route(id, resource)
+        options = self.get_options(kwargs)
+        if options:
+            url = '/'.join([url] + [quote(str(o), safe='') for o in options])
 
-        if resource:
-            url.path.segments.append(resource)
+        payload = kwargs.get('extra') or kwargs.get('data')
 
-        url.path.segments.extend(self.get_options(kwargs))
+        if profiler:
+            profiler.add('url', start)
 
-        payload = kwargs.get('extra') or kwargs.get('data')
+        if kwargs.get('stream'):
+            # A streamed body is read once by the caller, so it can't be cached.
+            return self._send(id, resource, verb, url, payload, stream=True)
+        if self.cache is None:
+            return self._send(id, resource, verb, url, payload)
+        if verb == 'get':
+            return self._cached_get(id, resource, url, payload)
+        response = self._send(id, resource, verb, url, payload)
+        if response.status_code < 400:
+            self.cache.invalidate(id, resource)
+        return response
+
+    def _cached_get(self, id, resource, url, payload):
+        key = self.cache.key(id, url, payload)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                return entry.response
+            if entry.is_usable_stale():
+                if self.cache.start_refresh(key):
+                    run_in_thread(self._refresh, key, id, resource, url, payload, entry)
+                return entry.response
+        return self._refresh(key, id, resource, url, payload, entry)
+
+    def _refresh(self, key, id, resource, url, payload, entry):
+        try:
+            headers = self.headers
+            if entry is not None and entry.etag:
+                headers = dict(headers, **{'If-None-Match': entry.etag})
+            response = self._send(id, resource, 'get', url, payload, headers)
+            if response.status_code == 304 and entry is not None:
+                self.cache.set(key, id, resource, entry.response)
+                return entry.response
+            if response.status_code == 200:
+                self.cache.set(key, id, resource, response)
+            return response
+        finally:
+            self.cache.end_refresh(key)
+
+    def _send(self, id, resource, verb, url, payload, headers=None, stream=False):
+        if verb == 'get' and not stream and self.single_flight is not None:
+            key = (id, url, json.dumps(payload, sort_keys=True, default=str),
+                   headers.get('If-None-Match') if headers else None)
+            return self.single_flight.do(key, self._send_request, id, resource, verb, url,
+                                         payload, headers)
+        return self._send_request(id, resource, verb, url, payload, headers, stream)
+
+    def _send_request(self, id, resource, verb, url, payload, headers=None, stream=False):
+        profiler = self.profiler
+        body_size = wire_size = 0
+        if verb in ['post', 'put']:
+            if profiler:
+                start = default_timer()
+            payload = self.codec.encode(payload)
+            body_size = wire_size = len(payload)
+            threshold = self.compress_threshold
+            if threshold is not None and body_size >= threshold:
+                payload = _gzip(payload)
+                wire_size = len(payload)
+                headers = dict(headers or self.headers, **{'Content-Encoding': 'gzip'})
+            if profiler:
+                profiler.add('encode', start)
+        attempts = [0]
+        if not self.listeners:
+            return self._send_attempts(id, verb, url, payload, headers, attempts, stream)
+
+        self._notify(RequestStarted(id, resource, verb, url))
+        start = default_timer()
+        response = error = None
+        try:
+            response = self._send_attempts(id, verb, url, payload, headers, attempts, stream)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._notify(RequestFinished(
+                store_id=id,
+                resource=resource,
+                verb=verb,
+                url=url,
+                status_code=response.status_code if response is not None else None,
+                elapsed=default_timer() - start,
+                request_bytes=body_size,
+                response_bytes=response_size(response) if response is not None and not stream else None,
+                retries=attempts[0] - 1,
+                error=error,
+                request_wire_bytes=wire_size,
+                response_wire_bytes=response_wire_size(response) if response is not None else None
+            ))
 
-        return _do_verb(verb, str(url), payload=payload, headers=self.headers)
\ No newline at end of file
+    def _send_attempts(self, id, verb, url, payload, headers, attempts, stream=False):
+        headers = headers or self.headers
+        retry_policy = self.retry_policy
+        errors = retry_policy.ERRORS if retry_policy else ()
+        while True:
+            attempts[0] += 1
+            attempt = attempts[0]
+            if self.rate_limiter:
+                self.rate_limiter.acquire(id)
+            profiler = self.profiler
+            if profiler:
+                start = default_timer()
+            try:
+                response = _do_verb(self.session, verb, url, payload=payload, headers=headers,
+                                    stream=stream)
+            except errors as e:
+                if profiler:
+                    profiler.add('network', start)
+                delay = retry_policy.get_delay(verb, attempt, error=e)
+                if delay is None:
+                    raise
+                event = RetryEvent(id, verb, url, attempt, delay, None, e)
+            else:
+                if profiler:
+                    profiler.add('network', start)
+                if self.rate_limiter:
+                    self.rate_limiter.update(id, response.status_code, response.headers)
+                if not retry_policy or response.status_code < 400:
+                    return response
+                delay = retry_policy.get_delay(verb, attempt, response=response)
+                if delay is None:
+                    return response
+                if stream:
+                    response.close()
+                event = RetryEvent(id, verb, url, attempt, delay, response.status_code, None)
+            retry_policy.notify(event)
+            self._notify(event)
+            time.sleep(delay)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry(object):
+
+    def __init__(self, store_id, resource, response, ttl, stale_ttl):
+        self.store_id = store_id
+        self.resource = resource
+        self.response = response
+        self.etag = _etag(response)
+        self.expires_at = time.time() + ttl
+        self.stale_until = self.expires_at + stale_ttl
+
+    def is_fresh(self):
+        return time.time() < self.expires_at
+
+    def is_usable_stale(self):
+        return time.time() < self.stale_until
+
+
+def _etag(response):
+    try:
+        etag = response.headers.get('ETag')
+    except AttributeError:
+        return None
+    return etag if isinstance(etag, str) else None
+
+
+class ResponseCache(object):
+    """
+    In-memory cache of GET responses, keyed by store, URL and params.
+
+    Entries live ``ttl`` seconds, or ``ttls[resource]`` for the resources
+    listed there, and at most ``max_entries`` are kept, dropping the least
+    recently used ones first. An expired entry can still be served for
+    ``stale_ttl`` more seconds while it is refreshed in the background.
+    Entries with an ETag are refreshed with a conditional request.
+    """
+
+    def __init__(self, max_entries=1000, ttl=60, ttls=None, stale_ttl=0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.stale_ttl = stale_ttl
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def key(self, store_id, url, params):
+        return (store_id, url, json.dumps(params, sort_keys=True, default=str))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, store_id, resource, response):
+        ttl = self.ttls.get(resource, self.ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = CacheEntry(store_id, resource, response, ttl, self.stale_ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def start_refresh(self, key):
+        """
+        Mark an entry as being refreshed. False if it already was.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, store_id, resource=None):
+        """
+        Drop the entries of a store, or only those of one of its resources.
+        """
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.store_id == store_id and resource in (None, entry.resource):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
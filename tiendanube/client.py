@@ -1,21 +1,107 @@
 # -*- coding: utf-8 -*-
+import itertools
+import threading
+from collections import OrderedDict, namedtuple
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
 from .api import APIClient
+from .concurrency import WorkerPool
 from .resources import (CategoryResource, CustomerResource,
                         OrderResource, ProductResource,
                         StoreResource, ScriptResource,
-                        WebhookResource)
+                        WebhookResource, AsyncCategoryResource,
+                        AsyncCustomerResource, AsyncOrderResource,
+                        AsyncProductResource, AsyncStoreResource,
+                        AsyncScriptResource, AsyncWebhookResource)
+
+
+StoreResult = namedtuple('StoreResult', ['store_id', 'result', 'error'])
+
+
+class _ThrottledClient(object):
+    """
+    Wraps an APIClient so at most ``limit`` requests made through it are
+    running at the same time.
+    """
+
+    def __init__(self, http_client, limit):
+        self._http_client = http_client
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    def make_request(self, *args, **kwargs):
+        with self._semaphore:
+            return self._http_client.make_request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._http_client, name)
+
+
+class _LazyResource(object):
+    """
+    A resource attribute of a store, built the first time it is read and
+    kept in the ``slot`` of the store.
+    """
+
+    def __init__(self, slot, resource_class):
+        self.slot = slot
+        self.resource_class = resource_class
+
+    def __get__(self, store, owner):
+        if store is None:
+            return self
+        try:
+            return getattr(store, self.slot)
+        except AttributeError:
+            resource = store._build(self.resource_class)
+            setattr(store, self.slot, resource)
+            return resource
+
+
+class _StoreHandles(object):
+    """
+    Store handles built with ``build(store_id)``, keyed by the store id as
+    a string. Only the most recently used ones are kept.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._stores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, store_id, max_stores):
+        store_id = str(store_id)
+        with self._lock:
+            store = self._stores.pop(store_id, None)
+            if store is None:
+                store = self._build(store_id)
+            self._stores[store_id] = store
+            while len(self._stores) > max_stores:
+                self._stores.popitem(last=False)
+            return store
 
 
 class Store(object):
+    __slots__ = ('_http_client', 'store_id', '_store', '_customers', '_products',
+                 '_categories', '_orders', '_scripts', '_webhooks')
+
+    store = _LazyResource('_store', StoreResource)
+    customers = _LazyResource('_customers', CustomerResource)
+    products = _LazyResource('_products', ProductResource)
+    categories = _LazyResource('_categories', CategoryResource)
+    orders = _LazyResource('_orders', OrderResource)
+    scripts = _LazyResource('_scripts', ScriptResource)
+    webhooks = _LazyResource('_webhooks', WebhookResource)
 
     def __init__(self, http_client, store_id):
-        self.store = StoreResource(http_client, store_id)
-        self.customers = CustomerResource(http_client, store_id)
-        self.products = ProductResource(http_client, store_id)
-        self.categories = CategoryResource(http_client, store_id)
-        self.orders = OrderResource(http_client, store_id)
-        self.scripts = ScriptResource(http_client, store_id)
-        self.webhooks = WebhookResource(http_client, store_id)
+        self._http_client = http_client
+        self.store_id = store_id
+
+    def _build(self, resource_class):
+        return resource_class(self._http_client, self.store_id)
 
     def get_info(self):
         return self.store.get()
@@ -23,8 +109,125 @@ class Store(object):
 
 class NubeClient(object):
 
-    def __init__(self, api_key, user_agent='MyNubeApp (mynubeapp.com)'):
-        self._http_client = APIClient(api_key, user_agent)
+    MAX_STORES = 1000
+
+    def __init__(self, api_key, user_agent='MyNubeApp (mynubeapp.com)', **http_options):
+        self._http_client = APIClient(api_key, user_agent, **http_options)
+        self._stores = _StoreHandles(lambda store_id: Store(self._http_client, store_id))
+
+    def get_store(self, store_id):
+        """
+        A handle on a store. Handles hold no state of their own, so they
+        are built once and kept, up to MAX_STORES of them.
+        """
+        return self._stores.get(store_id, self.MAX_STORES)
+
+    def get_rate_limit(self, store_id):
+        return self._http_client.get_rate_limit(store_id)
+
+    def get_requests_saved(self):
+        """
+        How many GETs shared the response of an identical one in flight,
+        when created with ``single_flight=True``.
+        """
+        flight = self._http_client.single_flight
+        return flight.saved if flight else 0
+
+    def add_listener(self, fn):
+        self._http_client.add_listener(fn)
+
+    def profile(self, profiler=None):
+        return self._http_client.profile(profiler)
+
+    def map_stores(self, store_ids, fn, concurrency=10, per_store_concurrency=None):
+        """
+        Call ``fn(store)`` for every store in ``store_ids``, running up to
+        ``concurrency`` of them at the same time.
+
+        Stores are started in the given order, and
+        ``per_store_concurrency`` caps the requests a single store can have
+        in flight, so one busy store can't take over every connection.
+
+        Yields a StoreResult for every store as soon as it is done. An
+        exception raised for a store is returned as its ``error``, the
+        other stores go on.
+        """
+        store_ids = iter(store_ids)
+        done = Queue()
+
+        def submit(pool, store_id):
+            def finished(future):
+                error = future.exception()
+                result = None if error else future.result()
+                done.put(StoreResult(store_id, result, error))
+
+            http_client = self._http_client
+            if per_store_concurrency:
+                http_client = _ThrottledClient(http_client, per_store_concurrency)
+            pool.submit(fn, Store(http_client, str(store_id))).add_done_callback(finished)
+
+        with WorkerPool(concurrency) as pool:
+            pending = 0
+            for store_id in itertools.islice(store_ids, concurrency):
+                submit(pool, store_id)
+                pending += 1
+            while pending:
+                result = done.get()
+                pending -= 1
+                for store_id in itertools.islice(store_ids, 1):
+                    submit(pool, store_id)
+                    pending += 1
+                yield result
+
+
+class AsyncStore(object):
+    __slots__ = ('_http_client', '_worker_pool', 'store_id', '_store', '_customers',
+                 '_products', '_categories', '_orders', '_scripts', '_webhooks')
+
+    store = _LazyResource('_store', AsyncStoreResource)
+    customers = _LazyResource('_customers', AsyncCustomerResource)
+    products = _LazyResource('_products', AsyncProductResource)
+    categories = _LazyResource('_categories', AsyncCategoryResource)
+    orders = _LazyResource('_orders', AsyncOrderResource)
+    scripts = _LazyResource('_scripts', AsyncScriptResource)
+    webhooks = _LazyResource('_webhooks', AsyncWebhookResource)
+
+    def __init__(self, http_client, worker_pool, store_id):
+        self._http_client = http_client
+        self._worker_pool = worker_pool
+        self.store_id = store_id
+
+    def _build(self, resource_class):
+        return resource_class(self._http_client, self.store_id, self._worker_pool)
+
+    def get_info(self):
+        return self.store.get()
+
+
+class AsyncNubeClient(object):
+    """
+    Like NubeClient, but every resource call returns a Future instead of
+    blocking. Up to ``max_workers`` requests, across all the stores of
+    this client, are in flight at the same time.
+    """
+
+    MAX_STORES = 1000
+
+    def __init__(self, api_key, user_agent='MyNubeApp (mynubeapp.com)',
+                 max_workers=100, **http_options):
+        http_options.setdefault('pool_maxsize', max_workers)
+        self._http_client = APIClient(api_key, user_agent, **http_options)
+        self._worker_pool = WorkerPool(max_workers)
+        self._stores = _StoreHandles(
+            lambda store_id: AsyncStore(self._http_client, self._worker_pool, store_id))
 
     def get_store(self, store_id):
-        return Store(self._http_client, str(store_id))
+        return self._stores.get(store_id, self.MAX_STORES)
+
+    def get_requests_saved(self):
+        flight = self._http_client.single_flight
+        return flight.saved if flight else 0
+
+    def close(self):
+        self._worker_pool.shutdown()
+        self._http_client.close()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import json
+import re
+
+from .resources.results import Result, ResultList
+
+
+_STRUCTURE = re.compile(br'["\[\]{},]')
+_STRING_END = re.compile(br'["\\]')
+
+
+def _fast_loads():
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        pass
+    try:
+        import simplejson
+        return simplejson.loads
+    except ImportError:
+        return json.loads
+
+
+def _default(obj):
+    if isinstance(obj, (Result, ResultList)):
+        return obj._data
+    raise TypeError('{!r} is not JSON serializable'.format(obj))
+
+
+def dumps(obj):
+    """
+    ``json.dumps`` that also encodes Result views, e.g. a fetched record
+    or one of its fields passed to add or update.
+    """
+    return json.dumps(obj, default=_default)
+
+
+class JSONCodec(object):
+    """
+    Encodes request payloads and decodes response bodies.
+
+    ``decode`` takes the raw response bytes, so no intermediate text copy
+    is made. By default decoding uses the fastest JSON library installed
+    (orjson, ujson or simplejson) and falls back to the standard library,
+    while encoding always uses the standard library so request bodies
+    look the same everywhere.
+    """
+
+    def __init__(self, loads=None, dumps=dumps):
+        self.loads = loads or _fast_loads()
+        self.dumps = dumps
+
+    def decode(self, content):
+        return self.loads(content)
+
+    def encode(self, obj):
+        return self.dumps(obj)
+
+    def iter_decode(self, chunks):
+        """
+        Decode a JSON array arriving in ``chunks`` of bytes, yielding each
+        element as soon as it is complete, so the whole body is never held
+        in memory at once.
+        """
+        return iter_array(chunks, self.loads)
+
+
+def iter_array(chunks, loads):
+    """
+    Split a JSON array read in chunks into its elements, decoding each one
+    with ``loads``. Only the element being read is kept in memory.
+    """
+    buf = b''
+    pos = 0
+    start = None
+    depth = 0
+    in_string = False
+    for chunk in chunks:
+        buf += chunk
+        while True:
+            if in_string:
+                match = _STRING_END.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if match.group() == b'\\':
+                    if match.end() >= len(buf):
+                        # The escaped character is in the next chunk.
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURE.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            char = match.group()
+            pos = match.end()
+            if char == b'"':
+                in_string = True
+            elif char in b'[{':
+                if depth == 0:
+                    if char != b'[':
+                        raise ValueError('Expected a JSON array.')
+                    start = pos
+                depth += 1
+            elif char in b']}':
+                depth -= 1
+                if depth == 0:
+                    element = buf[start:match.start()].strip()
+                    if element:
+                        yield loads(element)
+                    return
+            elif depth == 1:
+                yield loads(buf[start:match.start()])
+                start = pos
+
+        if start:
+            buf = buf[start:]
+            pos -= start
+            start = 0
+    raise ValueError('Truncated JSON array.')
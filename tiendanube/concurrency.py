@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import Future
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+
+def run_call(future, fn, args, kwargs):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+def run_in_thread(fn, *args, **kwargs):
+    """
+    Run ``fn`` in a new daemon thread and return its Future.
+    """
+    future = Future()
+    thread = threading.Thread(target=run_call, args=(future, fn, args, kwargs))
+    thread.daemon = True
+    thread.start()
+    return future
+
+
+class WorkerPool(object):
+    """
+    A bounded pool of daemon threads. Threads are started on demand, up
+    to ``max_workers``, and calls beyond that wait in a queue.
+
+    Calls running in the pool must not block waiting on other calls
+    submitted to the same pool, or they could wait forever.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._queue = Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        with self._lock:
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def map(self, fn, iterable):
+        """
+        Like ``map(fn, iterable)``, with the calls running in the pool.
+        Results keep the order of ``iterable``.
+        """
+        futures = [self.submit(fn, item) for item in iterable]
+        return [f.result() for f in futures]
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            run_call(*item)
+
+    def shutdown(self):
+        """
+        Stop the threads once the queued calls are done.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from collections import namedtuple
+
+
+RequestStarted = namedtuple('RequestStarted', ['store_id', 'resource', 'verb', 'url'])
+
+# ``request_bytes`` and ``response_bytes`` are the sizes of the encoded
+# payload and of the decoded response body, the ``*_wire_bytes`` what was
+# actually sent and received, after compression.
+RequestFinished = namedtuple('RequestFinished', [
+    'store_id', 'resource', 'verb', 'url', 'status_code', 'elapsed',
+    'request_bytes', 'response_bytes', 'retries', 'error',
+    'request_wire_bytes', 'response_wire_bytes'
+])
+
+
+def response_size(response):
+    try:
+        return len(response.content)
+    except TypeError:
+        return None
+
+
+def response_wire_size(response):
+    """
+    Bytes of the response body as received, from its Content-Length, or
+    None when it isn't known (e.g. a chunked compressed response).
+    """
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TransferCounter(object):
+    """
+    A listener adding up the payload and wire bytes of every request, to
+    see how much compression saves. Responses of unknown wire size are
+    counted in ``unknown_wire_size`` and left out of the response totals.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+        self.unknown_wire_size = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        if not isinstance(event, RequestFinished):
+            return
+        with self._lock:
+            self.requests += 1
+            self.request_bytes += event.request_bytes
+            self.request_wire_bytes += event.request_wire_bytes
+            if event.response_bytes is None or event.response_wire_bytes is None:
+                self.unknown_wire_size += 1
+            else:
+                self.response_bytes += event.response_bytes
+                self.response_wire_bytes += event.response_wire_bytes
+
+
+def log_requests(logger=None, level=logging.DEBUG):
+    """
+    A listener logging a line per finished request, for APIClient.add_listener.
+    """
+    logger = logger or logging.getLogger('tiendanube')
+
+    def listener(event):
+        if isinstance(event, RequestFinished) and logger.isEnabledFor(level):
+            logger.log(level, '%s %s %s %.3fs retries=%s',
+                       event.verb.upper(), event.url, event.status_code or event.error,
+                       event.elapsed, event.retries)
+    return listener
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import threading
+
+from .codec import JSONCodec
+from .resources.results import RAW, Result, convert
+from .sync import format_datetime, parse_datetime, resource_key
+
+
+_SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS records ('
+    ' store_id TEXT NOT NULL,'
+    ' resource TEXT NOT NULL,'
+    ' id INTEGER NOT NULL,'
+    ' updated_at TEXT,'
+    ' status TEXT,'
+    ' email TEXT,'
+    ' data TEXT NOT NULL,'
+    ' PRIMARY KEY (store_id, resource, id))',
+    'CREATE INDEX IF NOT EXISTS records_updated_at ON records (store_id, resource, updated_at)',
+    'CREATE INDEX IF NOT EXISTS records_status ON records (store_id, resource, status)',
+    'CREATE INDEX IF NOT EXISTS records_email ON records (store_id, resource, email)',
+    'CREATE TABLE IF NOT EXISTS skus ('
+    ' store_id TEXT NOT NULL,'
+    ' resource TEXT NOT NULL,'
+    ' id INTEGER NOT NULL,'
+    ' sku TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS skus_sku ON skus (store_id, resource, sku)',
+    'CREATE INDEX IF NOT EXISTS skus_record ON skus (store_id, resource, id)',
+]
+
+
+def _email(record):
+    customer = record.get('customer') or {}
+    return record.get('email') or record.get('contact_email') or customer.get('email')
+
+
+def _skus(record):
+    skus = set(variant.get('sku') for variant in record.get('variants') or [])
+    skus.add(record.get('sku'))
+    skus.discard(None)
+    skus.discard('')
+    return skus
+
+
+def _updated_at(record):
+    updated_at = record.get('updated_at')
+    return format_datetime(parse_datetime(updated_at)) if updated_at else None
+
+
+class Mirror(object):
+    """
+    Local SQLite copy of the records of store resources.
+
+    Records pulled from the API are upserted with their id, updated_at,
+    status, email (customer email or order contact email) and product
+    SKUs indexed, so internal tools can query them without calling the
+    API. Queries return the same result objects as the live client.
+    """
+
+    def __init__(self, path, codec=None):
+        self.codec = codec or JSONCodec()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+
+    def close(self):
+        self._db.close()
+
+    def upsert(self, resource, records):
+        """
+        Insert or replace ``records`` of a resource, e.g. ``store.orders``.
+        """
+        store_id, name = str(resource.store_id), resource_key(resource)
+        rows = []
+        skus = []
+        for record in records:
+            if isinstance(record, Result):
+                record = record.toDict()
+            rows.append((store_id, name, record['id'], _updated_at(record),
+                         record.get('status'), _email(record), self.codec.encode(record)))
+            skus.extend((store_id, name, record['id'], sku) for sku in _skus(record))
+        with self._lock, self._db:
+            self._db.executemany(
+                'DELETE FROM skus WHERE store_id = ? AND resource = ? AND id = ?',
+                [row[:3] for row in rows]
+            )
+            self._db.executemany(
+                'INSERT OR REPLACE INTO records'
+                ' (store_id, resource, id, updated_at, status, email, data)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+            )
+            self._db.executemany(
+                'INSERT INTO skus (store_id, resource, id, sku) VALUES (?, ?, ?, ?)', skus
+            )
+        return len(rows)
+
+    def pull(self, resource, filters={}, per_page=200, batch_size=500):
+        """
+        Upsert every record of ``resource`` matching ``filters`` from the
+        API. Returns how many records were pulled.
+        """
+        records = resource.iter_all(filters, per_page=per_page, mode=RAW)
+        return self._upsert_batches(resource, records, batch_size)
+
+    def pull_changes(self, engine, resource, batch_size=500):
+        """
+        Upsert the records of ``resource`` changed since the last sync of
+        ``engine``, a SyncEngine.
+        """
+        return self._upsert_batches(resource, engine.changes(resource, mode=RAW), batch_size)
+
+    def _upsert_batches(self, resource, records, batch_size):
+        count = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                count += self.upsert(resource, batch)
+                batch = []
+        if batch:
+            count += self.upsert(resource, batch)
+        return count
+
+    def delete(self, resource, ids):
+        store_id, name = str(resource.store_id), resource_key(resource)
+        keys = [(store_id, name, id) for id in ids]
+        with self._lock, self._db:
+            self._db.executemany(
+                'DELETE FROM records WHERE store_id = ? AND resource = ? AND id = ?', keys)
+            self._db.executemany(
+                'DELETE FROM skus WHERE store_id = ? AND resource = ? AND id = ?', keys)
+
+    def get(self, resource, id, mode=None):
+        """
+        A mirrored record by id, or None if it isn't in the mirror.
+        """
+        records = self.query(resource, ids=[id], mode=RAW)
+        return convert(records[0], mode) if records else None
+
+    def query(self, resource, ids=None, status=None, email=None, sku=None,
+              updated_at_min=None, updated_at_max=None, order_by='id',
+              limit=None, mode=None):
+        """
+        Mirrored records of ``resource`` matching every filter given.
+        ``updated_at_min`` and ``updated_at_max`` take datetimes or ISO
+        8601 strings. Results are like those of ``resource.list`` for the
+        same ``mode``.
+        """
+        if order_by not in ('id', 'updated_at'):
+            raise ValueError('Records can only be ordered by id or updated_at.')
+
+        where = ['r.store_id = ?', 'r.resource = ?']
+        params = [str(resource.store_id), resource_key(resource)]
+        join = ''
+        if ids is not None:
+            ids = list(ids)
+            where.append('r.id IN ({})'.format(', '.join('?' * len(ids)) or 'NULL'))
+            params.extend(ids)
+        if status is not None:
+            where.append('r.status = ?')
+            params.append(status)
+        if email is not None:
+            where.append('r.email = ?')
+            params.append(email)
+        if sku is not None:
+            join = (' JOIN skus s ON s.store_id = r.store_id AND s.resource = r.resource'
+                    ' AND s.id = r.id AND s.sku = ?')
+            params.insert(0, sku)
+        for value, operator in ((updated_at_min, '>='), (updated_at_max, '<=')):
+            if value is not None:
+                if hasattr(value, 'isoformat'):
+                    value = value.isoformat()
+                where.append('r.updated_at {} ?'.format(operator))
+                params.append(format_datetime(parse_datetime(value)))
+
+        sql = 'SELECT DISTINCT r.id, r.data FROM records r{} WHERE {} ORDER BY r.{}'.format(
+            join, ' AND '.join(where), order_by)
+        if limit is not None:
+            sql += ' LIMIT {:d}'.format(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return convert([self.codec.decode(data) for _, data in rows], mode)
+
+    def count(self, resource):
+        with self._lock:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM records WHERE store_id = ? AND resource = ?',
+                (str(resource.store_id), resource_key(resource))
+            ).fetchone()[0]
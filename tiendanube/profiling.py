@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict, namedtuple
+from timeit import default_timer
+
+
+PhaseStats = namedtuple('PhaseStats', ['calls', 'total', 'mean', 'max'])
+
+
+class Profiler(object):
+    """
+    Collects how long each phase of the request pipeline takes:
+
+    * ``url``: building the URL and payload in APIClient.make_request.
+    * ``encode``: encoding the payload of a write.
+    * ``network``: sending the request and reading the response, once per
+      attempt.
+    * ``decode``: decoding the response body.
+    * ``wrap``: turning the decoded body into result objects.
+
+    ``samples`` keeps every ``(phase, seconds)`` measured, in order.
+    """
+    PHASES = ('url', 'encode', 'network', 'decode', 'wrap')
+
+    def __init__(self):
+        self.samples = []
+
+    def add(self, phase, start):
+        """
+        Record a phase that started at ``start``, a default_timer() value.
+        """
+        self.samples.append((phase, default_timer() - start))
+
+    def summary(self):
+        """
+        PhaseStats (calls, total, mean and max seconds) of every phase seen.
+        """
+        times = OrderedDict((phase, []) for phase in self.PHASES)
+        for phase, seconds in self.samples:
+            times.setdefault(phase, []).append(seconds)
+        return OrderedDict(
+            (phase, PhaseStats(len(t), sum(t), sum(t) / len(t), max(t)))
+            for phase, t in times.items() if t
+        )
+
+    def table(self):
+        """
+        The summary as a text table, times in milliseconds.
+        """
+        summary = self.summary()
+        total = sum(stats.total for stats in summary.values()) or 1
+        lines = ['{:<8} {:>7} {:>11} {:>9} {:>9} {:>6}'.format(
+            'phase', 'calls', 'total ms', 'mean ms', 'max ms', '%')]
+        for phase, stats in summary.items():
+            lines.append('{:<8} {:>7} {:>11.3f} {:>9.3f} {:>9.3f} {:>6.1f}'.format(
+                phase, stats.calls, stats.total * 1000, stats.mean * 1000,
+                stats.max * 1000, stats.total * 100 / total))
+        return '\n'.join(lines)
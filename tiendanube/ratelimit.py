@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import namedtuple
+
+
+BucketState = namedtuple('BucketState', ['limit', 'remaining', 'reset'])
+
+
+def _header_int(headers, name):
+    try:
+        return int(headers.get(name))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class _Bucket(object):
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.level = 0.0
+        self.updated_at = time.time()
+
+
+class RateLimiter(object):
+    """
+    Paces requests to stay under the API leaky bucket rate limit.
+
+    The API gives every store a bucket of ``limit`` requests that leaks
+    ``leak_rate`` requests per second. A bucket is kept per store_id,
+    filled by every request sent and synced with the ``x-rate-limit-*``
+    headers of every response. ``acquire`` blocks while taking a request
+    would leave less than ``headroom`` free slots.
+
+    It is thread safe, so a single limiter can be shared by every thread
+    using the same APIClient.
+    """
+    LIMIT = 40
+    LEAK_RATE = 2.0
+
+    LIMIT_HEADER = 'x-rate-limit-limit'
+    REMAINING_HEADER = 'x-rate-limit-remaining'
+    RESET_HEADER = 'x-rate-limit-reset'
+
+    def __init__(self, limit=LIMIT, leak_rate=LEAK_RATE, headroom=1):
+        self.limit = limit
+        self.leak_rate = leak_rate
+        self.headroom = headroom
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, store_id):
+        bucket = self._buckets.get(store_id)
+        if bucket is None:
+            bucket = self._buckets[store_id] = _Bucket(self.limit)
+        now = time.time()
+        bucket.level = max(0.0, bucket.level - (now - bucket.updated_at) * self.leak_rate)
+        bucket.updated_at = now
+        return bucket
+
+    def acquire(self, store_id):
+        """
+        Wait until there is room in the bucket of the store and take a slot.
+        """
+        while True:
+            with self._lock:
+                bucket = self._bucket(store_id)
+                allowed = max(1, bucket.limit - self.headroom)
+                if bucket.level + 1 <= allowed:
+                    bucket.level += 1
+                    return
+                wait = (bucket.level + 1 - allowed) / self.leak_rate
+            time.sleep(wait)
+
+    def update(self, store_id, status_code, headers):
+        """
+        Sync the bucket of the store with an API response.
+        """
+        limit = _header_int(headers, self.LIMIT_HEADER)
+        remaining = _header_int(headers, self.REMAINING_HEADER)
+        with self._lock:
+            bucket = self._bucket(store_id)
+            if limit:
+                bucket.limit = limit
+            if remaining is not None:
+                bucket.level = max(bucket.level, float(bucket.limit - remaining))
+            if status_code == 429:
+                bucket.level = float(bucket.limit)
+
+    def bucket(self, store_id):
+        """
+        Current state of the bucket of a store: its size, the requests
+        left before hitting the limit and the seconds until it is empty.
+        """
+        with self._lock:
+            bucket = self._bucket(store_id)
+            return BucketState(
+                limit=bucket.limit,
+                remaining=int(bucket.limit - bucket.level),
+                reset=bucket.level / self.leak_rate
+            )
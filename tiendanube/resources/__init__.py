@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
-import json
-
-from bunch import bunchify
-
+from .asynchronous import AsyncListResource, AsyncResource
 from .base import ListResource, Resource
-from .decorators import subresources
+from .decorators import crawl_subresource, subresources
 
 class CategoryResource(ListResource):
 
@@ -26,6 +23,14 @@ class ProductResource(ListResource):
 
     resource_name = 'products'
 
+    def crawl_subresource(self, subresource, product_ids=None, concurrency=10,
+                          per_page=ListResource.MAX_PER_PAGE, mode=None):
+        """
+        Stream ``(product_id, item)`` pairs of the variants or images of
+        many products, crawling up to ``concurrency`` products at a time.
+        """
+        return crawl_subresource(self, subresource, product_ids, concurrency, per_page, mode)
+
 
 class ScriptResource(ListResource):
 
@@ -38,9 +43,55 @@ class StoreResource(Resource):
         """
         Get a single store.
         """
-        return bunchify(json.loads(self._make_request('store').content))
+        return self._decode(self._make_request('store'))
+
+
+class AsyncStoreResource(AsyncResource):
+
+    sync_class = StoreResource
+
+    def get(self):
+        return self._submit(self._resource.get)
 
 
 class WebhookResource(ListResource):
 
     resource_name = 'webhooks'
+
+
+class AsyncCategoryResource(AsyncListResource):
+
+    sync_class = CategoryResource
+
+
+class AsyncCustomerResource(AsyncListResource):
+
+    sync_class = CustomerResource
+
+
+class AsyncOrderResource(AsyncListResource):
+
+    sync_class = OrderResource
+
+
+class AsyncProductResource(AsyncListResource):
+
+    sync_class = ProductResource
+
+    def crawl_subresource(self, subresource, product_ids=None, concurrency=10,
+                          per_page=ListResource.MAX_PER_PAGE, mode=None):
+        """
+        Same as ``ProductResource.crawl_subresource``, already concurrent.
+        """
+        return self._resource.crawl_subresource(subresource, product_ids, concurrency,
+                                                per_page, mode)
+
+
+class AsyncScriptResource(AsyncListResource):
+
+    sync_class = ScriptResource
+
+
+class AsyncWebhookResource(AsyncListResource):
+
+    sync_class = WebhookResource
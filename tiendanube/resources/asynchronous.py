@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+
+from .base import ListResource, ListSubResource, Resource
+from .results import Lazy, Result, attach
+
+
+# A page of records and the number of the next one, None after the last.
+Page = namedtuple('Page', ['records', 'next_page'])
+
+
+class AsyncResource(object):
+    """
+    Non-blocking mirror of a Resource. Calls go through the same
+    APIClient, so URLs and errors are the same, but they run on a shared
+    WorkerPool and return a Future right away.
+    """
+    sync_class = Resource
+
+    def __init__(self, api_client, store_id, worker_pool):
+        self.store_id = store_id
+        self._pool = worker_pool
+        self._resource = self.sync_class(api_client, store_id)
+
+    def _submit(self, fn, *args, **kwargs):
+        return self._pool.submit(fn, *args, **kwargs)
+
+
+class AsyncListResource(AsyncResource):
+    sync_class = ListResource
+
+    def get(self, id, mode=None, include=None):
+        return self._submit(self._get, id, mode, include)
+
+    def _get(self, id, mode, include):
+        if include:
+            obj = self._resource.get(id, mode, include=include)
+        else:
+            obj = self._resource.get(id, mode)
+        if not isinstance(obj, Result):
+            return obj
+        for subresource in getattr(self._resource, 'subresource_names', []):
+            if include and subresource in include:
+                continue
+            attach(obj, subresource, Lazy(self._subresource, id, subresource))
+        return obj
+
+    def _subresource(self, id, subresource):
+        return AsyncListSubResource(ListSubResource(self._resource, id, subresource), self._pool)
+
+    def list(self, filters={}, fields={}, mode=None, **options):
+        return self._submit(self._resource.list, filters, fields, mode, **options)
+
+    def get_page(self, page=1, filters={}, fields={}, per_page=ListResource.MAX_PER_PAGE,
+                 mode=None):
+        """
+        Fetch a page of the records ``iter_all`` gives. The Future gives a
+        Page with its ``records`` and the ``next_page`` number, None after
+        the last one, so every page is fetched without blocking.
+        """
+        self._resource._check_pages(per_page, mode)
+        return self._submit(self._get_page, page, filters, fields, per_page, mode)
+
+    def _get_page(self, page, filters, fields, per_page, mode):
+        records = self._resource._fetch_page(page, filters, fields, per_page, mode)
+        return Page(records, page + 1 if len(records) >= per_page else None)
+
+    def add(self, resource_dict):
+        return self._submit(self._resource.add, resource_dict)
+
+    def update(self, resource_update_dict):
+        return self._submit(self._resource.update, resource_update_dict)
+
+    def add_many(self, records, max_workers=10, key=None, skip=()):
+        return self._submit(self._resource.add_many, records, max_workers, key, skip)
+
+    def update_many(self, records, max_workers=10, skip=()):
+        return self._submit(self._resource.update_many, records, max_workers, skip)
+
+
+class AsyncListSubResource(AsyncListResource):
+    sync_class = ListSubResource
+
+    def __init__(self, subresource, worker_pool):
+        self.store_id = subresource.store_id
+        self._pool = worker_pool
+        self._resource = subresource
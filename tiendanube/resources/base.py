@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 import datetime
-import json
+from timeit import default_timer
 
-from bunch import bunchify
+from requests.exceptions import RequestException
 
+from ..concurrency import WorkerPool, run_in_thread
+from .bulk import run_bulk
 from .exceptions import APIError
+from .results import Columns, Result, convert
 
 
 def _get_value(val):
@@ -13,6 +16,15 @@ def _get_value(val):
     return val
 
 
+def _get_extra(filters, fields, mode):
+    extra = {k:_get_value(v) for k,v in filters.items()}
+    if not fields and getattr(mode, 'fields', None):
+        fields = ','.join(mode.fields)
+    if fields:
+        extra['fields'] = fields
+    return extra
+
+
 class Resource(object):
 
     def __init__(self, api_client, store_id):
@@ -27,27 +39,187 @@ class Resource(object):
                            response.status_code)
         return response
 
+    def _decode(self, response, mode=None):
+        profiler = self._http_client.profiler
+        if not profiler:
+            return convert(self._http_client.codec.decode(response.content), mode)
+
+        start = default_timer()
+        data = self._http_client.codec.decode(response.content)
+        profiler.add('decode', start)
+        start = default_timer()
+        result = convert(data, mode)
+        profiler.add('wrap', start)
+        return result
+
 
 class ListResource(Resource):
+    """
+    The ``mode`` of get and list says how records are returned: Result
+    views by default, ``results.RAW`` for the decoded JSON, or a
+    ``results.Tuples`` / ``results.Columns`` projection of some fields.
+    """
+
+    MAX_PER_PAGE = 200
+    STREAM_CHUNK_SIZE = 16 * 1024
 
-    def get(self, id):
-        return bunchify(json.loads(self._make_request(self.resource_name, resource_id=str(id)).content))
+    def get(self, id, mode=None):
+        return self._decode(self._make_request(self.resource_name, resource_id=str(id)), mode)
 
-    def list(self, filters={}, fields={}):
+    def get_many(self, ids, max_workers=10, mode=None):
+        """
+        Get several records by id, with up to ``max_workers`` requests
+        running at the same time.
+
+        Results keep the order of ``ids``. When getting a record fails its
+        APIError, or the connection error or timeout left after retries, is
+        returned in its place, the rest of the batch goes on.
+        """
+        def get(id):
+            try:
+                return self.get(id, mode=mode)
+            except (APIError, RequestException) as e:
+                return e
+
+        with WorkerPool(max_workers) as pool:
+            return pool.map(get, ids)
+
+    def _list_options(self):
+        return {}
+
+    def list(self, filters={}, fields={}, mode=None):
         """
         Get the list of customers for a store.
         """
-        extra = {k:_get_value(v) for k,v in filters.items()}
-        if fields:
-            extra['fields'] = fields
-        return bunchify(json.loads(self._make_request(self.resource_name, extra=extra).content))
+        extra = _get_extra(filters, fields, mode)
+        return self._decode(self._make_request(
+            self.resource_name, extra=extra, **self._list_options()), mode)
+
+    def stream(self, filters={}, fields={}, mode=None):
+        """
+        Like ``list``, but the response is read in chunks and each record
+        is yielded as soon as it is parsed, so memory use doesn't grow with
+        the page size. Columns mode is not supported.
+        """
+        if isinstance(mode, Columns):
+            raise ValueError('stream yields records, Columns mode is not supported.')
+
+        extra = _get_extra(filters, fields, mode)
+        response = self._make_request(
+            self.resource_name, extra=extra, stream=True, **self._list_options())
+        return self._iter_stream(response, mode)
+
+    def _iter_stream(self, response, mode):
+        codec = self._http_client.codec
+        try:
+            for record in codec.iter_decode(response.iter_content(self.STREAM_CHUNK_SIZE)):
+                yield convert(record, mode)
+        finally:
+            response.close()
+
+    def iter_all(self, filters={}, fields={}, per_page=MAX_PER_PAGE, mode=None, stream=False):
+        """
+        Lazily iterate over every record, fetching one page at a time.
+
+        While the records of a page are being consumed the next page is
+        already being fetched in the background. With ``stream`` each page
+        is read like in ``stream`` instead, one page after the other, so a
+        single record is kept in memory. Columns mode is not supported
+        since records are yielded one by one.
+
+        A page shorter than ``per_page`` is the last one, so ``per_page``
+        can't be over the MAX_PER_PAGE the API serves.
+        """
+        self._check_pages(per_page, mode)
+        if stream:
+            return self._iter_all_streamed(filters, fields, per_page, mode)
+        return self._iter_all(filters, fields, per_page, mode)
+
+    def _check_pages(self, per_page, mode):
+        if not 0 < per_page <= self.MAX_PER_PAGE:
+            raise ValueError('per_page must be between 1 and {}.'.format(self.MAX_PER_PAGE))
+        if isinstance(mode, Columns):
+            raise ValueError('iter_all yields records, Columns mode is not supported.')
+
+    def _fetch_page(self, page, filters, fields, per_page, mode, stream=False):
+        """
+        The records of a page, none past the last one.
+        """
+        page_filters = dict(filters, page=page, per_page=per_page)
+        try:
+            if stream:
+                return self.stream(page_filters, fields, mode)
+            return self.list(page_filters, fields, mode)
+        except APIError as e:
+            # The API answers 404 when asking for a page past the last one.
+            if e.code == 404 and page > 1:
+                return []
+            raise
+
+    def _iter_all_streamed(self, filters, fields, per_page, mode):
+        page = 1
+        while True:
+            count = 0
+            for record in self._fetch_page(page, filters, fields, per_page, mode, stream=True):
+                count += 1
+                yield record
+            if count < per_page:
+                return
+            page += 1
+
+    def _iter_all(self, filters, fields, per_page, mode):
+        page = 1
+        records = self._fetch_page(page, filters, fields, per_page, mode)
+        while records:
+            next_page = None
+            if len(records) >= per_page:
+                next_page = run_in_thread(
+                    self._fetch_page, page + 1, filters, fields, per_page, mode)
+            for record in records:
+                yield record
+            if next_page is None:
+                return
+            page += 1
+            records = next_page.result()
 
     def add(self, resource_dict):
-        return bunchify(json.loads(self._make_request(self.resource_name, data=resource_dict, verb='post').text))
+        return self._decode(self._make_request(self.resource_name, data=resource_dict, verb='post'))
 
     def update(self, resource_update_dict):
+        """
+        Update a record from a dict with its id and the fields to change,
+        or from a fetched Result, sending only its id and changed fields.
+        """
         res_id = str(resource_update_dict['id'])
-        return bunchify(json.loads(self._make_request(self.resource_name, resource_id=res_id, data=resource_update_dict, verb='put').text))
+        if isinstance(resource_update_dict, Result):
+            data = resource_update_dict.changes()
+        else:
+            data = resource_update_dict
+        result = self._decode(self._make_request(self.resource_name, resource_id=res_id, data=data, verb='put'))
+        if isinstance(resource_update_dict, Result):
+            resource_update_dict.clear_changes()
+        return result
+
+    def add_many(self, records, max_workers=10, key=None, skip=()):
+        """
+        Add several records, with up to ``max_workers`` requests running
+        at the same time, all paced by the store rate limit.
+
+        Returns a BulkReport: a record failing, e.g. with an APIError, a
+        connection error or data that can't be encoded, doesn't stop the
+        rest. POSTs are only retried when the API refused them without
+        processing (429), so a record is never added twice by a retry. To
+        resume a batch, pass ``key`` (e.g. a function giving the product
+        handle) and ``skip=report.done_keys()`` of the last run.
+        """
+        return run_bulk(self.add, records, key, skip, max_workers)
+
+    def update_many(self, records, max_workers=10, skip=()):
+        """
+        Update several records, like ``add_many``. Records are keyed by
+        id, so the same record isn't updated twice in a batch.
+        """
+        return run_bulk(self.update, records, lambda record: record['id'], skip, max_workers)
 
 class ListSubResource(ListResource):
 
@@ -57,27 +229,17 @@ class ListSubResource(ListResource):
         self.resource_id = resource_id
         self.subresource = subresource
 
-    def get(self, id):
-        return bunchify(json.loads(self._make_request(
+    def get(self, id, mode=None):
+        return self._decode(self._make_request(
             self.resource_name,
             resource_id=str(self.resource_id),
             subresource=self.subresource,
-            subresource_id=str(id)).content)
+            subresource_id=str(id)),
+            mode
         )
 
-    def list(self, filters={}, fields={}):
-        """
-        Get the list of customers for a store.
-        """
-        extra = {k:_get_value(v) for k,v in filters.items()}
-        if fields:
-            extra['fields'] = fields
-        return bunchify(json.loads(self._make_request(
-            self.resource_name,
-            resource_id=str(self.resource_id),
-            subresource=self.subresource,
-            extra=extra).content)
-        )
+    def _list_options(self):
+        return {'resource_id': str(self.resource_id), 'subresource': self.subresource}
 
     def add(self, subresource_dict):
         raise NotImplementedError('Sub resource add is not yet supported.')
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+
+from ..concurrency import WorkerPool
+
+
+# Outcome of one record of a bulk write: its position in the input, its
+# key, the record sent, and either the result or the error it failed with
+# (e.g. an APIError, a connection error left after retries, or a record
+# that can't be encoded).
+BulkItem = namedtuple('BulkItem', ['index', 'key', 'record', 'result', 'error'])
+
+
+class BulkReport(object):
+    """
+    What happened to every record of an ``add_many`` or ``update_many``,
+    in input order.
+    """
+
+    def __init__(self, items):
+        self.items = items
+
+    @property
+    def succeeded(self):
+        return [item for item in self.items if item.error is None]
+
+    @property
+    def failed(self):
+        return [item for item in self.items if item.error is not None]
+
+    @property
+    def ok(self):
+        return all(item.error is None for item in self.items)
+
+    def done_keys(self):
+        """
+        Keys of the records written, to ``skip`` when running the same
+        batch again.
+        """
+        return set(item.key for item in self.items if item.error is None)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return 'BulkReport(succeeded={}, failed={})'.format(
+            len(self.succeeded), len(self.failed))
+
+
+def run_bulk(write, records, key, skip, max_workers):
+    """
+    Call ``write(record)`` for every record not in ``skip`` with up to
+    ``max_workers`` calls at a time, and report the outcomes. Records with
+    a key already seen in the batch are not written twice.
+    """
+    skip = set(skip)
+    seen = set()
+    items = []
+    pending = []
+    for index, record in enumerate(records):
+        record_key = key(record) if key else index
+        if record_key in skip:
+            continue
+        if record_key in seen:
+            items.append(BulkItem(index, record_key, record, None,
+                                  ValueError('Duplicate key: {}'.format(record_key))))
+            continue
+        seen.add(record_key)
+        pending.append((index, record_key, record))
+
+    def run(item):
+        index, record_key, record = item
+        try:
+            return BulkItem(index, record_key, record, write(record), None)
+        except Exception as e:
+            return BulkItem(index, record_key, record, None, e)
+
+    with WorkerPool(max_workers) as pool:
+        items.extend(pool.map(run, pending))
+    return BulkReport(sorted(items, key=lambda item: item.index))
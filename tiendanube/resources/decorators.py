@@ -1,21 +1,130 @@
 # -*- coding: utf-8 -*-
-from .base import ListSubResource
+import itertools
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+from requests.exceptions import RequestException
+
+from ..concurrency import WorkerPool
+from .base import ListResource, ListSubResource
+from .exceptions import APIError
+from .results import RAW, Columns, Lazy, Result, _unwrap, attach
+
+
+def _check_include(subresource_names, include, mode):
+    unknown = [name for name in include if name not in subresource_names]
+    if unknown:
+        raise ValueError('Unknown subresources: {}'.format(', '.join(unknown)))
+    if mode not in (None, RAW):
+        raise ValueError('Subresources are included in records, use None or RAW mode.')
+
+
+def include_subresources(resource, records, include, max_workers=10):
+    """
+    Make sure every record has the ``include`` subresources in its data.
+    Those not already embedded in the payload are fetched, every page of
+    them, with up to ``max_workers`` requests at the same time.
+    """
+    missing = [(record, name) for record in map(_unwrap, records)
+               for name in include if name not in record]
+    if not missing:
+        return
+
+    def fetch(item):
+        record, name = item
+        return list(ListSubResource(resource, record['id'], name).iter_all(mode=RAW))
+
+    with WorkerPool(min(max_workers, len(missing))) as pool:
+        for (record, name), items in zip(missing, pool.map(fetch, missing)):
+            record[name] = items
+
+
+def crawl_subresource(resource, subresource, ids=None, concurrency=10,
+                      per_page=ListResource.MAX_PER_PAGE, mode=None):
+    """
+    Yield ``(id, item)`` for every item of ``subresource`` of the records
+    with the given ``ids`` (every record by default), paginating each
+    one. Up to ``concurrency`` records are crawled at the same time, and
+    the items of a record are yielded together as soon as it is done.
+
+    When a record fails its APIError, or the connection error or timeout
+    left after retries, is yielded as its only item, the crawl goes on.
+    """
+    if subresource not in resource.subresource_names:
+        raise ValueError('Unknown subresource: {}'.format(subresource))
+    if isinstance(mode, Columns):
+        raise ValueError('crawl_subresource yields items, Columns mode is not supported.')
+    if ids is None:
+        ids = (record['id'] for record in resource.iter_all(fields='id', mode=RAW))
+    ids = iter(ids)
+    done = Queue()
+
+    def fetch(id):
+        try:
+            return list(ListSubResource(resource, id, subresource).iter_all(
+                per_page=per_page, mode=mode))
+        except (APIError, RequestException) as e:
+            return [e]
+
+    def submit(pool, id):
+        pool.submit(fetch, id).add_done_callback(lambda future: done.put((id, future)))
+
+    with WorkerPool(concurrency) as pool:
+        pending = 0
+        for id in itertools.islice(ids, concurrency):
+            submit(pool, id)
+            pending += 1
+        while pending:
+            id, future = done.get()
+            pending -= 1
+            for next_id in itertools.islice(ids, 1):
+                submit(pool, next_id)
+                pending += 1
+            for item in future.result():
+                yield id, item
 
 
 def subresources(subresource_names):
     def _decorated(klass):
         orig_get = klass.get
+        orig_list = klass.list
 
-        def get_wrapper(self, id):
-            obj = orig_get(self, id)
+        def get_wrapper(self, id, mode=None, include=None):
+            """
+            Get a record. Subresources in ``include`` are read from the
+            payload when embedded, otherwise fetched concurrently, and are
+            part of the record data. The others are attached as
+            ListSubResource handles.
+            """
+            if include:
+                _check_include(subresource_names, include, mode)
+            obj = orig_get(self, id, mode)
+            if include:
+                include_subresources(self, [obj], include)
+            if not isinstance(obj, Result):
+                return obj
             for subresource in subresource_names:
-                setattr(
-                    obj,
-                    subresource,
-                    ListSubResource(self, id, subresource)
-                )
+                if include and subresource in include:
+                    continue
+                attach(obj, subresource, Lazy(ListSubResource, self, id, subresource))
             return obj
 
+        def list_wrapper(self, filters={}, fields={}, mode=None, include=None, max_workers=10):
+            """
+            List records, with the subresources in ``include`` as in get.
+            """
+            if include:
+                _check_include(subresource_names, include, mode)
+            records = orig_list(self, filters, fields, mode)
+            if include:
+                include_subresources(self, records, include, max_workers)
+            return records
+
         klass.get = get_wrapper
+        klass.list = list_wrapper
+        klass.subresource_names = subresource_names
         return klass
-    return _decorated
\ No newline at end of file
+    return _decorated
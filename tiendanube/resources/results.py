@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+
+
+RAW = 'raw'
+
+
+def convert(data, mode=None):
+    """
+    Turn decoded JSON into what the given result mode asks for: Result
+    views by default, the decoded JSON itself for RAW, or a Tuples or
+    Columns projection.
+    """
+    if mode is None:
+        return to_result(data)
+    if mode == RAW:
+        return data
+    return mode.convert(data)
+
+
+class Tuples(object):
+    """
+    Result mode giving a tuple of ``fields`` per record, a namedtuple
+    unless ``named`` is False. Missing fields are None.
+    """
+
+    def __init__(self, fields, named=True):
+        self.fields = tuple(fields)
+        self._make = namedtuple('Record', self.fields)._make if named else tuple
+
+    def convert(self, data):
+        if isinstance(data, list):
+            return [self._row(record) for record in data]
+        return self._row(data)
+
+    def _row(self, record):
+        return self._make([record.get(field) for field in self.fields])
+
+
+class Columns(object):
+    """
+    Result mode giving a dict with a list of values per field in
+    ``fields``, one value per record.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+
+    def convert(self, data):
+        records = data if isinstance(data, list) else [data]
+        return dict((field, [record.get(field) for record in records])
+                    for field in self.fields)
+
+
+def to_result(data):
+    """
+    Wrap decoded JSON for attribute access. A top level list becomes a
+    list of wrapped items, nested values are only wrapped when read.
+    """
+    if isinstance(data, list):
+        return [_wrap(item) for item in data]
+    return _wrap(data)
+
+
+def _wrap(value):
+    if isinstance(value, dict):
+        return Result(value)
+    if isinstance(value, list):
+        return ResultList(value)
+    return value
+
+
+def _wrap_child(value, parent, key):
+    # Nested views report changes up to the top level record.
+    if isinstance(value, dict):
+        child = Result(value)
+    elif isinstance(value, list):
+        child = ResultList(value)
+    else:
+        return value
+    object.__setattr__(child, '_parent', (parent, key))
+    return child
+
+
+def _unwrap(value):
+    if isinstance(value, (Result, ResultList)):
+        return value._data
+    return value
+
+
+def attach(result, name, helper):
+    """
+    Attach ``helper`` to ``result`` as attribute ``name``, in front of the
+    data. A Lazy helper is only built when first read.
+    """
+    if result._attached is None:
+        object.__setattr__(result, '_attached', {})
+    result._attached[name] = helper
+
+
+class Lazy(object):
+    """
+    A helper to attach to a Result, built with ``factory(*args)`` the
+    first time it is read.
+    """
+    __slots__ = ('factory', 'args')
+
+    def __init__(self, factory, *args):
+        self.factory = factory
+        self.args = args
+
+    def build(self):
+        return self.factory(*self.args)
+
+
+class Result(object):
+    """
+    View over a decoded JSON object. Keys can be read as attributes or
+    items, ``p.name.es`` or ``p['name']['es']``, and it compares equal to
+    the dict it wraps.
+
+    Data is changed by setting attributes or items, ``p.handle = 'camisa'``
+    or ``p['name']['es'] = 'Camisa'``, and the top level fields changed
+    since fetching are tracked, so an update only needs to send those (see
+    ``changes``).
+
+    Helpers (e.g. subresources) are attached with ``attach``, they are
+    looked up before the data and never sent.
+    """
+    __slots__ = ('_data', '_attached', '_parent', '_changed')
+
+    def __init__(self, data):
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_attached', None)
+        object.__setattr__(self, '_parent', None)
+        object.__setattr__(self, '_changed', None)
+
+    def __getattr__(self, name):
+        # Slots are unset while copy and pickle build the object.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attached = self._attached
+        if attached and name in attached:
+            value = attached[name]
+            if type(value) is Lazy:
+                value = attached[name] = value.build()
+            return value
+        try:
+            return _wrap_child(self._data[name], self, name)
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        attached = self._attached
+        if attached and name in attached:
+            del attached[name]
+        self[name] = value
+
+    def __getstate__(self):
+        # Attached helpers hold API clients, copies only keep the data.
+        return dict(self._data), set(self._changed or ())
+
+    def __setstate__(self, state):
+        data, changed = state
+        Result.__init__(self, data)
+        object.__setattr__(self, '_changed', changed or None)
+
+    def __getitem__(self, key):
+        return _wrap_child(self._data[key], self, key)
+
+    def __setitem__(self, key, value):
+        self._data[key] = _unwrap(value)
+        self._mark(key)
+
+    def _mark(self, key):
+        if self._parent is not None:
+            parent, parent_key = self._parent
+            parent._mark(parent_key)
+        elif self._changed is None:
+            object.__setattr__(self, '_changed', set([key]))
+        else:
+            self._changed.add(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return self._data == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Result({!r})'.format(self._data)
+
+    def get(self, key, default=None):
+        return _wrap_child(self._data.get(key, default), self, key)
+
+    def keys(self):
+        return list(self._data.keys())
+
+    def values(self):
+        return [_wrap_child(v, self, k) for k, v in self._data.items()]
+
+    def items(self):
+        return [(k, _wrap_child(v, self, k)) for k, v in self._data.items()]
+
+    def toDict(self):
+        """
+        The wrapped dict itself, not a copy.
+        """
+        return self._data
+
+    def changed_fields(self):
+        """
+        Names of the top level fields changed since fetching.
+        """
+        return set(self._changed or ())
+
+    def changes(self):
+        """
+        The id and the changed fields, what an update needs to send.
+        """
+        changes = dict((key, self._data[key]) for key in self._changed or ()
+                       if key in self._data)
+        if 'id' in self._data:
+            changes['id'] = self._data['id']
+        return changes
+
+    def clear_changes(self):
+        object.__setattr__(self, '_changed', None)
+
+
+class ResultList(object):
+    """
+    View over a decoded JSON array, wrapping items when read. Setting an
+    item marks the record holding the array as changed.
+    """
+    __slots__ = ('_data', '_parent')
+
+    def __init__(self, data):
+        self._data = data
+        self._parent = None
+
+    def __reduce__(self):
+        return ResultList, (list(self._data),)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResultList(self._data[index])
+        return _wrap_child(self._data[index], self, index)
+
+    def __setitem__(self, index, value):
+        self._data[index] = _unwrap(value)
+        self._mark(index)
+
+    def _mark(self, index):
+        if self._parent is not None:
+            parent, parent_key = self._parent
+            parent._mark(parent_key)
+
+    def __iter__(self):
+        for index, item in enumerate(self._data):
+            yield _wrap_child(item, self, index)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return self._data == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'ResultList({!r})'.format(self._data)
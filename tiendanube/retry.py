@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+import time
+from collections import deque, namedtuple
+
+from requests.exceptions import ConnectionError, Timeout
+
+
+RetryEvent = namedtuple('RetryEvent', ['store_id', 'verb', 'url', 'attempt',
+                                       'delay', 'status_code', 'error'])
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before retrying a failed request.
+
+    Requests failing with one of ``statuses`` or a connection error are
+    retried up to ``max_attempts`` total attempts, only for ``verbs``
+    (the idempotent ones by default). Responses with one of ``REFUSED``
+    mean the request wasn't processed at all, so those are retried for
+    every verb, POST included. The wait honors the Retry-After
+    header, otherwise it is a random time between 0 and
+    ``min(backoff_cap, backoff_base * 2 ** attempt)`` (full jitter).
+
+    At most ``budget`` retries are made every ``budget_window`` seconds,
+    across all the requests using this policy, so retries can't pile up
+    while the API is down.
+
+    Every ``listeners`` callable gets a RetryEvent before each retry.
+    """
+    STATUSES = (429, 500, 502, 503, 504)
+    VERBS = ('get', 'head', 'options', 'put', 'delete')
+    ERRORS = (ConnectionError, Timeout)
+    REFUSED = (429,)
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_cap=30,
+                 statuses=STATUSES, verbs=VERBS, budget=20, budget_window=60,
+                 listeners=None):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.statuses = statuses
+        self.verbs = verbs
+        self.budget = budget
+        self.budget_window = budget_window
+        self.listeners = list(listeners or [])
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def add_listener(self, fn):
+        self.listeners.append(fn)
+
+    def _take_budget(self):
+        with self._lock:
+            now = time.time()
+            while self._retries and self._retries[0] <= now - self.budget_window:
+                self._retries.popleft()
+            if len(self._retries) >= self.budget:
+                return False
+            self._retries.append(now)
+            return True
+
+    def backoff(self, attempt, response=None):
+        """
+        Seconds to wait after the given failed attempt (counting from 1).
+        """
+        if response is not None:
+            try:
+                return max(0.0, float(response.headers.get('Retry-After')))
+            except (AttributeError, TypeError, ValueError):
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def get_delay(self, verb, attempt, response=None, error=None):
+        """
+        Seconds to wait before retrying a failed attempt, or None when it
+        must not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if error is None and response.status_code not in self.statuses:
+            return None
+        if verb not in self.verbs and (error is not None or
+                                       response.status_code not in self.REFUSED):
+            return None
+        if not self._take_budget():
+            return None
+        return self.backoff(attempt, response)
+
+    def notify(self, event):
+        for listener in self.listeners:
+            listener(event)
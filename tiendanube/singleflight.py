@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from .concurrency import Future
+
+
+class SingleFlight(object):
+    """
+    Runs a call only once for concurrent callers asking for the same key:
+    callers arriving while it is in flight wait for it and all get its
+    result, or its exception. A call starting after it finished runs
+    again.
+
+    ``calls`` counts the calls actually made, ``saved`` the callers that
+    shared the result of one already in flight.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.saved = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                self._flights[key] = Future()
+                self.calls += 1
+            else:
+                self.saved += 1
+        if flight is not None:
+            return flight.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self._land(key).set_exception(e)
+            raise
+        self._land(key).set_result(result)
+        return result
+
+    def _land(self, key):
+        with self._lock:
+            return self._flights.pop(key)